@@ -1,5 +1,15 @@
 import chess
 import random
+from array import array
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the evaluator falls back to NumPy
+    njit = None
 
 # Piece values
 piece_values = {
@@ -88,135 +98,556 @@ piece_square_tables = {
     chess.KING: king_table
 }
 
-def evaluate_board(board, sos_scores=None):
+# Material + positional value per [color, piece_type, square], black tables mirrored
+# and negated so a whole board scores as one white-positive sum.
+# NumPy treats bool indices as masks, so colors are indexed with plain ints.
+WHITE_IDX = int(chess.WHITE)
+BLACK_IDX = int(chess.BLACK)
+PST_COMBINED = np.zeros((2, 7, 64), dtype=np.int32)
+for _pt, _table in piece_square_tables.items():
+    PST_COMBINED[WHITE_IDX, _pt] = [piece_values[_pt] + _table[s] for s in chess.SQUARES]
+    PST_COMBINED[BLACK_IDX, _pt] = [-(piece_values[_pt] + _table[chess.square_mirror(s)]) for s in chess.SQUARES]
+SIGNED_MATERIAL = np.zeros((2, 7), dtype=np.float64)
+SIGNED_MATERIAL[WHITE_IDX, 1:] = [piece_values[pt] for pt in chess.PIECE_TYPES]
+SIGNED_MATERIAL[BLACK_IDX, 1:] = [-piece_values[pt] for pt in chess.PIECE_TYPES]
+
+# Material by piece type as a C int array (index 0 unused) for move ordering
+PIECE_VALUE = array('i', [0] + [piece_values[pt] for pt in chess.PIECE_TYPES])
+
+# Lower-case square names ("a1".."h8") indexed by square, as used for SOS keys
+SQUARE_NAMES = tuple(chess.square_name(s).lower() for s in chess.SQUARES)
+
+# Transposition table: tt_key(board) -> (depth, value, flag, best_move).
+# Entries depend on the SOS map, so get_best_moves clears it when that changes.
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+TT_MAX_ENTRIES = 1_000_000
+
+transposition_table = {}
+_tt_sos_key = None
+
+# Quiet-move ordering: two killer slots per ply and a (from, to) history score,
+# both filled from beta cutoffs and reset for every get_best_moves call.
+MAX_DEPTH = 64
+killers = [[None, None] for _ in range(MAX_DEPTH)]
+history = defaultdict(int)
+
+# Ply from which the early king-walk and queen-sortie penalties no longer apply
+EARLY_PENALTY_PLY = 20
+
+# Ply from which evaluate_board no longer depends on the move number (SOS
+# weight is full at 24 ply, the penalties stop at EARLY_PENALTY_PLY)
+TT_PLY_CAP = max(24, EARLY_PENALTY_PLY)
+
+# Depth reduction for the null-move search
+NULL_MOVE_R = 2
+
+# Root scores this close to the best are treated as tied for first
+TIE_EPSILON = 1e-6
+
+# Aspiration half-width (centipawns) for root siblings searched in parallel
+ROOT_WINDOW = 200
+
+def piece_bitboards(board):
+    """Piece bitboards as a (2, 7) uint64 array laid out like PST_COMBINED."""
+    white = board.occupied_co[chess.WHITE]
+    black = board.occupied_co[chess.BLACK]
+    by_type = (0, board.pawns, board.knights, board.bishops, board.rooks, board.queens, board.kings)
+    bitboards = np.zeros((2, 7), dtype='<u8')
+    bitboards[WHITE_IDX] = [bb & white for bb in by_type]
+    bitboards[BLACK_IDX] = [bb & black for bb in by_type]
+    return bitboards
+
+# De Bruijn bit-scan: isolating the lowest set bit and multiplying by this constant
+# puts a unique 6-bit pattern in the top bits, which indexes the square number.
+DEBRUIJN64 = np.uint64(0x03F79D71B4CB0A89)
+DEBRUIJN_INDEX = np.zeros(64, dtype=np.int64)
+for _sq in range(64):
+    DEBRUIJN_INDEX[((1 << _sq) * 0x03F79D71B4CB0A89 & 0xFFFFFFFFFFFFFFFF) >> 58] = _sq
+
+def _score_bitboards(bitboards, pst, signed_material, sos_values, debruijn_index):
+    """Compiled when numba is available: visit only each bitboard's set bits and sum table entries."""
+    pst_score = 0
+    sos_score = 0.0
+    one = np.uint64(1)
+    shift = np.uint64(58)
+    for color in range(2):
+        for pt in range(1, 7):
+            bb = bitboards[color, pt]
+            while bb:
+                sq = debruijn_index[((bb & (~bb + one)) * DEBRUIJN64) >> shift]
+                pst_score += pst[color, pt, sq]
+                sos_score += sos_values[sq] * signed_material[color, pt]
+                bb &= bb - one
+    return pst_score, sos_score
+
+_score_bitboards_jit = njit(cache=True)(_score_bitboards) if njit is not None else None
+NO_SOS = np.zeros(64, dtype=np.float64)
+
+def score_pieces(board, sos_values=None):
+    """
+    White-positive material + positional score, and the SOS material bonus
+    before its 0.3 * opp_weight scaling (0.0 without SOS values).
+    """
+    bitboards = piece_bitboards(board)
+    if _score_bitboards_jit is not None:
+        pst_score, sos_score = _score_bitboards_jit(bitboards, PST_COMBINED, SIGNED_MATERIAL, NO_SOS if sos_values is None else sos_values, DEBRUIJN_INDEX)
+        return int(pst_score), float(sos_score)
+
+    # One 0/1 occupancy plane per (color, piece type)
+    planes = np.unpackbits(bitboards.view(np.uint8), bitorder='little').reshape(2, 7, 64)
+    pst_score = int((planes * PST_COMBINED).sum())
+    if sos_values is None:
+        return pst_score, 0.0
+    opp_by_type = planes @ sos_values  # summed opportunity under each (color, piece type)
+    return pst_score, float((opp_by_type * SIGNED_MATERIAL).sum())
+
+# Plain-list copies of the tables for scalar lookups in piece_delta
+PST_LIST = PST_COMBINED.tolist()
+MATERIAL_LIST = SIGNED_MATERIAL.tolist()
+
+def piece_delta(board, move, sos_values=None):
+    """
+    Change in score_pieces() caused by move, computed before it is pushed:
+    the moved (or promoted) piece, the captured piece (en passant included)
+    and the rook on castling. sos_values is a per-square sequence or None.
+    """
+    us = int(board.turn)
+    them = 1 - us
+    from_sq, to_sq = move.from_square, move.to_square
+    pt = board.piece_type_at(from_sq)
+    to_pt = move.promotion or pt
+    pst_us = PST_LIST[us]
+    dpst = pst_us[to_pt][to_sq] - pst_us[pt][from_sq]
+    moved = [(to_pt, to_sq, 1), (pt, from_sq, -1)]
+
+    if pt == chess.KING and board.is_castling(move):
+        rank = from_sq & ~7
+        if to_sq > from_sq:
+            rook_from, rook_to = rank + 7, rank + 5
+        else:
+            rook_from, rook_to = rank, rank + 3
+        dpst += pst_us[chess.ROOK][rook_to] - pst_us[chess.ROOK][rook_from]
+        moved += [(chess.ROOK, rook_to, 1), (chess.ROOK, rook_from, -1)]
+        captured = None
+    elif pt == chess.PAWN and board.is_en_passant(move):
+        captured, capture_sq = chess.PAWN, to_sq - 8 if us == WHITE_IDX else to_sq + 8
+    else:
+        captured, capture_sq = board.piece_type_at(to_sq), to_sq
+    if captured:
+        dpst -= PST_LIST[them][captured][capture_sq]
+
+    if sos_values is None:
+        return dpst, 0.0
+    material_us = MATERIAL_LIST[us]
+    dsos = 0.0
+    for piece_type, square, sign in moved:
+        dsos += sign * material_us[piece_type] * sos_values[square]
+    if captured:
+        dsos -= MATERIAL_LIST[them][captured] * sos_values[capture_sq]
+    return dpst, dsos
+
+def child_pieces(board, move, pieces, sos):
+    """score_pieces() of the position after move, updated incrementally from the parent's."""
+    dpst, dsos = piece_delta(board, move, sos.value_tuple if sos is not None else None)
+    return pieces[0] + dpst, pieces[1] + dsos
+
+# Search-ready SOS map: per-square values (as an array for the vectorised scorer
+# and as a tuple of floats for cheap scalar indexing), a bitboard of the positive
+# squares the control-of-squares term looks at, and the sum of those positive values.
+SOSMap = namedtuple('SOSMap', ['values', 'value_tuple', 'control_mask', 'control_total'])
+
+def prepare_sos(sos_scores):
+    """Convert a {square_name: opportunity} dict to an SOSMap (None if empty); SOSMaps pass through."""
+    if sos_scores is None or isinstance(sos_scores, SOSMap):
+        return sos_scores
+    if not sos_scores:
+        return None
+    value_tuple = tuple(float(sos_scores.get(name, 0)) for name in SQUARE_NAMES)
+    control_mask = 0
+    control_total = 0.0
+    for square, value in enumerate(value_tuple):
+        if value > 0:
+            control_mask |= chess.BB_SQUARES[square]
+            control_total += value
+    return SOSMap(np.array(value_tuple, dtype=np.float64), value_tuple, control_mask, control_total)
+
+def evaluate_board(board, sos_scores=None, alpha=-float('inf'), beta=float('inf'), pieces=None):
     """
     Static evaluation (white-positive). Material + positional + opportunity bonus
     (higher opportunity = better for White = lower risk) and simple control of
     opportunity-heavy squares. Positive score favors White; negative favors Black.
+    sos_scores may be a square-name dict or an SOSMap from prepare_sos.
+
+    alpha/beta enable lazy evaluation: if the cheap terms already put the score
+    outside the window by more than the control term could move it, the
+    attack scan is skipped and the nearest bound is returned instead.
+
+    pieces is this position's score_pieces() result when the caller already
+    has it (the search keeps it up to date incrementally).
+
+    Checkmate and stalemate are not detected here (that needs a legal-move
+    generation per call); minimax and quiesce find them from their own move
+    loops before a position is evaluated.
     """
-    if board.is_checkmate():
-        # If it's checkmate, the side to move has lost.
-        return float('inf') if board.turn == chess.BLACK else -float('inf')
-    if board.is_stalemate() or board.is_insufficient_material():
+    sos = prepare_sos(sos_scores)
+    if board.is_insufficient_material():
         return 0
 
     # SoS is opportunity; weight it lightly in the opening and ramp to full midgame.
     ply_count = (board.fullmove_number - 1) * 2 + (0 if board.turn == chess.WHITE else 1)
     opp_weight = 0.1 + 0.9 * min(1.0, max(0.0, ply_count / 24.0))  # 10% early, 100% by ~24 ply
 
-    total_score = 0
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if not piece:
-            continue
-
-        material_score = piece_values[piece.piece_type]
-
-        # Positional score: tables are white-oriented; mirror for black pieces
-        if piece.color == chess.WHITE:
-            positional_score = piece_square_tables[piece.piece_type][square]
-        else:
-            positional_score = piece_square_tables[piece.piece_type][chess.square_mirror(square)]
-
-        # SOS bonus: scale only by base material to avoid compounding
-        sos_bonus = 0
-        if sos_scores:
-            # sos here is opportunity: higher = better for White (lower risk)
-            opp = sos_scores.get(chess.square_name(square).lower(), 0)
-            sos_bonus = opp * (material_score * 0.3 * opp_weight)
-
-        piece_score = material_score + positional_score + sos_bonus
+    # Material + positional, plus the SOS bonus scaled only by base material to
+    # avoid compounding (sos is opportunity: higher = better for White)
+    if pieces is None:
+        pieces = score_pieces(board, sos.values if sos is not None else None)
+    total_score, sos_bonus = pieces
+    if sos is not None:
+        total_score += sos_bonus * 0.3 * opp_weight
+
+    # Penalize early king walks (encourage castling/safety) and premature queen sorties.
+    # Every penalty has faded out by EARLY_PENALTY_PLY, so later positions skip the block.
+    if ply_count < EARLY_PENALTY_PLY:
+        def apply_penalty(is_white: bool, amount: float):
+            nonlocal total_score
+            total_score -= amount if is_white else -amount
+
+        # King safety: discourage king off its home square early unless castled.
+        # Cheap square test first; castling rights are only looked up for a moved king.
+        wk_sq = board.king(chess.WHITE)
+        bk_sq = board.king(chess.BLACK)
+        if wk_sq is not None and wk_sq != chess.E1:
+            if not (board.has_kingside_castling_rights(chess.WHITE) or board.has_queenside_castling_rights(chess.WHITE)):
+                penalty = max(0, 1200 - ply_count * 40)  # strong early deterrent, fades by 20 ply
+                apply_penalty(True, penalty)
+        if bk_sq is not None and bk_sq != chess.E8:
+            if not (board.has_kingside_castling_rights(chess.BLACK) or board.has_queenside_castling_rights(chess.BLACK)):
+                penalty = max(0, 1200 - ply_count * 40)
+                apply_penalty(False, penalty)
+
+        # Early queen development penalty
+        def queen_penalty(color, home_square, ply_cutoff=14, base_penalty=400):
+            qbb = board.queens & board.occupied_co[color]
+            if qbb and not (qbb & chess.BB_SQUARES[home_square]) and ply_count < ply_cutoff:
+                return max(0, base_penalty - ply_count * 20)
+            return 0
 
-        if piece.color == chess.WHITE:
-            total_score += piece_score
-        else:
-            total_score -= piece_score
+        qpen_w = queen_penalty(chess.WHITE, chess.D1)
+        if qpen_w:
+            apply_penalty(True, qpen_w)
+        qpen_b = queen_penalty(chess.BLACK, chess.D8)
+        if qpen_b:
+            apply_penalty(False, qpen_b)
 
     # Control of opportunity-heavy squares: reward White control, penalize Black
-    if sos_scores:
+    if sos is not None:
+        # Lazy cut: the control term lies within +/- control_margin
+        control_margin = sos.control_total * (10 * opp_weight)
+        if total_score + control_margin < alpha:
+            return total_score + control_margin
+        if total_score - control_margin > beta:
+            return total_score - control_margin
+
         control_score = 0
-        for square in chess.SQUARES:
-            opp = sos_scores.get(chess.square_name(square).lower(), 0)
-            if opp <= 0:
-                continue
-            if board.is_attacked_by(chess.WHITE, square):
-                control_score += opp * (10 * opp_weight)  # reward White influence over good squares
-            if board.is_attacked_by(chess.BLACK, square):
-                control_score -= opp * (10 * opp_weight)  # penalize White if Black controls them
+        control_weight = 10 * opp_weight
+        values = sos.value_tuple
+        for square in chess.scan_reversed(sos.control_mask):
+            opp = values[square]
+            if board.attackers_mask(chess.WHITE, square):
+                control_score += opp * control_weight  # reward White influence over good squares
+            if board.attackers_mask(chess.BLACK, square):
+                control_score -= opp * control_weight  # penalize White if Black controls them
         total_score += control_score
 
-    # Penalize early king walks (encourage castling/safety) and premature queen sorties
-    def apply_penalty(is_white: bool, amount: float):
-        nonlocal total_score
-        total_score -= amount if is_white else -amount
-
-    # King safety: discourage king off its home square early unless castled
-    wk_sq = board.king(chess.WHITE)
-    bk_sq = board.king(chess.BLACK)
-    if wk_sq is not None:
-        white_king_moved = wk_sq != chess.E1
-        white_castling_rights = board.has_kingside_castling_rights(chess.WHITE) or board.has_queenside_castling_rights(chess.WHITE)
-        if white_king_moved and ply_count < 20 and white_castling_rights is False:
-            penalty = max(0, 1200 - ply_count * 40)  # strong early deterrent, fades by 20 ply
-            apply_penalty(True, penalty)
-    if bk_sq is not None:
-        black_king_moved = bk_sq != chess.E8
-        black_castling_rights = board.has_kingside_castling_rights(chess.BLACK) or board.has_queenside_castling_rights(chess.BLACK)
-        if black_king_moved and ply_count < 20 and black_castling_rights is False:
-            penalty = max(0, 1200 - ply_count * 40)
-            apply_penalty(False, penalty)
-
-    # Early queen development penalty
-    def queen_penalty(color, home_square, ply_cutoff=14, base_penalty=400):
-        qs = list(board.pieces(chess.QUEEN, color))
-        if not qs:
-            return 0
-        qsq = qs[0]
-        if qsq != home_square and ply_count < ply_cutoff:
-            return max(0, base_penalty - ply_count * 20)
-        return 0
-
-    qpen_w = queen_penalty(chess.WHITE, chess.D1)
-    if qpen_w:
-        apply_penalty(True, qpen_w)
-    qpen_b = queen_penalty(chess.BLACK, chess.D8)
-    if qpen_b:
-        apply_penalty(False, qpen_b)
-
     return total_score
 
-def minimax(board, depth, alpha, beta, maximizing_for_white, sos_scores):
-    """Minimax with alpha-beta pruning. maximizing_for_white=True means we want a higher score for White."""
-    if depth == 0 or board.is_game_over():
-        return evaluate_board(board, sos_scores)
+def order_moves(board, moves, tt_move=None, ply=None):
+    """
+    Sort moves in place for alpha-beta: the transposition-table move first, then
+    captures by Most-Valuable-Victim / Least-Valuable-Attacker, then killer moves
+    for this ply, then remaining quiet moves by history score.
+    """
+    ply_killers = killers[ply] if ply is not None and ply < MAX_DEPTH else (None, None)
+
+    def move_score(m):
+        if m == tt_move:
+            return 10**6
+        if board.is_capture(m):
+            # En passant leaves the target square empty; the victim is a pawn
+            victim = PIECE_VALUE[board.piece_type_at(m.to_square) or chess.PAWN]
+            attacker = PIECE_VALUE[board.piece_type_at(m.from_square)]
+            return 10**5 + 10 * victim - attacker
+        if m == ply_killers[0]:
+            return 9000
+        if m == ply_killers[1]:
+            return 8000
+        return history[(m.from_square, m.to_square)]
+
+    moves.sort(key=move_score, reverse=True)
+    return moves
+
+def record_cutoff(board, move, depth, ply):
+    """Remember a quiet move that caused a beta cutoff (killer + history)."""
+    if board.is_capture(move):
+        return
+    if ply < MAX_DEPTH:
+        ply_killers = killers[ply]
+        if move != ply_killers[0]:
+            ply_killers[1] = ply_killers[0]
+            ply_killers[0] = move
+    history[(move.from_square, move.to_square)] += depth * depth
+
+def has_non_pawn_material(board):
+    """True if the side to move has a knight, bishop, rook or queen."""
+    return bool(board.occupied_co[board.turn] & ~board.pawns & ~board.kings)
+
+def mated_score(board):
+    """Score for a checkmate against the side to move (white-positive)."""
+    return -float('inf') if board.turn == chess.WHITE else float('inf')
+
+def quiesce(board, alpha, beta, maximizing_for_white, sos_scores, pieces=None):
+    """
+    Quiescence search: extend leaves through captures only (MVV-LVA ordered)
+    until the position is quiet, so the static evaluation is never taken in the
+    middle of an exchange. The side to move may stand pat unless it is in
+    check, in which case every evasion is searched (and none means mate).
+    sos_scores is an SOSMap (or None); pieces is the position's score_pieces().
+    """
+    if pieces is None:
+        pieces = score_pieces(board, sos_scores.values if sos_scores is not None else None)
+    if board.is_check():
+        evasions = list(board.generate_legal_moves())
+        if not evasions:
+            return mated_score(board)
+        stand_pat = None
+        best_value = -float('inf') if maximizing_for_white else float('inf')
+        moves = order_moves(board, evasions)
+    else:
+        stand_pat = evaluate_board(board, sos_scores, alpha, beta, pieces)
+        if maximizing_for_white:
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+        else:
+            if stand_pat <= alpha:
+                return stand_pat
+            beta = min(beta, stand_pat)
+        best_value = stand_pat
+        moves = order_moves(board, list(board.generate_pseudo_legal_captures()))
+
+    for move in moves:
+        # Captures come from the pseudo-legal generator
+        if stand_pat is not None and not board.is_legal(move):
+            continue
+        child = child_pieces(board, move, pieces, sos_scores)
+        board.push(move)
+        eval = quiesce(board, alpha, beta, not maximizing_for_white, sos_scores, child)
+        board.pop()
+        if maximizing_for_white:
+            best_value = max(best_value, eval)
+            alpha = max(alpha, eval)
+        else:
+            best_value = min(best_value, eval)
+            beta = min(beta, eval)
+        if beta <= alpha:
+            break
+    return best_value
 
+def minimax(board, depth, alpha, beta, maximizing_for_white, sos_scores, ply=0, pieces=None):
+    """
+    Minimax with alpha-beta pruning. maximizing_for_white=True means we want a higher score for White.
+    ply is the distance from the root, used to index the killer-move slots.
+    sos_scores is an SOSMap (or None). pieces is the position's score_pieces(),
+    computed here if not given and then updated per move instead of rescanning
+    the board at every leaf.
+    """
+    if pieces is None:
+        pieces = score_pieces(board, sos_scores.values if sos_scores is not None else None)
+    if depth == 0:
+        return quiesce(board, alpha, beta, maximizing_for_white, sos_scores, pieces)
+
+    # Probe the transposition table; deep-enough entries can cut or narrow the window.
+    key = tt_key(board)
+    entry = transposition_table.get(key)
+    tt_move = None
+    if entry is not None:
+        entry_depth, entry_value, entry_flag, tt_move = entry
+        if entry_depth >= depth:
+            if entry_flag == TT_EXACT:
+                return entry_value
+            if entry_flag == TT_LOWER:
+                alpha = max(alpha, entry_value)
+            else:
+                beta = min(beta, entry_value)
+            if beta <= alpha:
+                return entry_value
+    alpha_orig, beta_orig = alpha, beta
+
+    # Null-move pruning: if passing still fails high at reduced depth, a real
+    # move will too. Skipped in check, right after another null move, when the
+    # side to move has only pawns (zugzwang-prone endings), and when there is
+    # no finite bound to fail against.
+    null_bound = beta if maximizing_for_white else alpha
+    if (depth >= 3 and abs(null_bound) != float('inf') and not board.is_check()
+            and has_non_pawn_material(board) and not (board.move_stack and not board.move_stack[-1])):
+        board.push(chess.Move.null())
+        if maximizing_for_white:
+            null_value = minimax(board, depth - 1 - NULL_MOVE_R, beta - 1, beta, False, sos_scores, ply + 1, pieces)
+        else:
+            null_value = minimax(board, depth - 1 - NULL_MOVE_R, alpha, alpha + 1, True, sos_scores, ply + 1, pieces)
+        board.pop()
+        if (null_value >= beta) if maximizing_for_white else (null_value <= alpha):
+            return null_bound
+
+    # Pseudo-legal moves are validated only when actually tried, so moves cut
+    # off by alpha-beta never pay for the king-safety check.
+    moves = list(board.pseudo_legal_moves)
+    if depth > 1:
+        order_moves(board, moves, tt_move, ply)
+    elif tt_move is not None and tt_move in moves:
+        # Children are leaves here, so full ordering costs more than it saves
+        moves.remove(tt_move)
+        moves.insert(0, tt_move)
+
+    best_move = None
     if maximizing_for_white:
-        max_eval = -float('inf')
-        for move in board.legal_moves:
+        best_value = -float('inf')
+        for move in moves:
+            if not board.is_legal(move):
+                continue
+            child = child_pieces(board, move, pieces, sos_scores)
             board.push(move)
-            eval = minimax(board, depth - 1, alpha, beta, False, sos_scores)
+            eval = minimax(board, depth - 1, alpha, beta, False, sos_scores, ply + 1, child)
             board.pop()
-            max_eval = max(max_eval, eval)
+            if best_move is None or eval > best_value:
+                best_value = eval
+                best_move = move
             alpha = max(alpha, eval)
             if beta <= alpha:
+                record_cutoff(board, move, depth, ply)
                 break
-        return max_eval
     else:
-        min_eval = float('inf')
-        for move in board.legal_moves:
+        best_value = float('inf')
+        for move in moves:
+            if not board.is_legal(move):
+                continue
+            child = child_pieces(board, move, pieces, sos_scores)
             board.push(move)
-            eval = minimax(board, depth - 1, alpha, beta, True, sos_scores)
+            eval = minimax(board, depth - 1, alpha, beta, True, sos_scores, ply + 1, child)
             board.pop()
-            min_eval = min(min_eval, eval)
+            if best_move is None or eval < best_value:
+                best_value = eval
+                best_move = move
             beta = min(beta, eval)
             if beta <= alpha:
+                record_cutoff(board, move, depth, ply)
                 break
-        return min_eval
 
-def get_best_moves(board, sos_scores=None, num_moves=3, depth=3):
+    if best_move is None:
+        # No legal move: checkmate or stalemate, detected without a separate
+        # is_game_over() move generation at every node.
+        return mated_score(board) if board.is_check() else 0
+
+    if best_value <= alpha_orig:
+        flag = TT_UPPER
+    elif best_value >= beta_orig:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    if len(transposition_table) >= TT_MAX_ENTRIES:
+        transposition_table.clear()
+    transposition_table[key] = (depth, best_value, flag, best_move)
+    return best_value
+
+def tt_key(board):
+    """
+    Transposition-table key: the position plus the game ply up to TT_PLY_CAP,
+    since evaluate_board scores the same placement differently by move number.
+    """
+    ply_count = (board.fullmove_number - 1) * 2 + (0 if board.turn == chess.WHITE else 1)
+    return board._transposition_key(), min(ply_count, TT_PLY_CAP)
+
+def reset_search_state(sos_scores):
+    """Clear killers/history for a new search; drop cached TT scores if the SOS map changed."""
+    global _tt_sos_key
+    sos_key = tuple(sorted(sos_scores.items())) if sos_scores else None
+    if sos_key != _tt_sos_key:
+        transposition_table.clear()
+        _tt_sos_key = sos_key
+    for ply_killers in killers:
+        ply_killers[0] = ply_killers[1] = None
+    history.clear()
+
+def _search_root_move(fen, move_uci, depth, sos_scores, alpha, beta):
+    """Process-pool worker: score one root move of the position given as FEN."""
+    reset_search_state(sos_scores)
+    board = chess.Board(fen)
+    board.push(chess.Move.from_uci(move_uci))
+    return minimax(board, depth - 1, alpha, beta, board.turn == chess.WHITE, prepare_sos(sos_scores), 1)
+
+def search_root_parallel(board, moves, depth, sos_scores, rank_key, num_moves, workers):
+    """
+    Young Brothers Wait at the root. The first (best-ordered) move is searched
+    here with a full window; its siblings are searched in worker processes with
+    an aspiration window around that score. A sibling that falls outside the
+    window only has a bound, so it is re-searched with a full window whenever it
+    could still rank in the top num_moves by rank_key(move, score), descending.
+    Returns (move, score) pairs; only moves outside the top num_moves may keep
+    bound scores.
+    """
+    inf = float('inf')
+    maximizing_for_white = board.turn == chess.WHITE
+    sos = prepare_sos(sos_scores)
+
+    def full_search(move):
+        board.push(move)
+        score = minimax(board, depth - 1, -inf, inf, not maximizing_for_white, sos, 1)
+        board.pop()
+        return score
+
+    first_score = full_search(moves[0])
+    if maximizing_for_white:
+        alpha, beta = first_score - ROOT_WINDOW, inf
+    else:
+        alpha, beta = -inf, first_score + ROOT_WINDOW
+
+    fen = board.fen()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_search_root_move, fen, move.uci(), depth, sos_scores, alpha, beta) for move in moves[1:]]
+        sibling_scores = [future.result() for future in futures]
+
+    # bound: 0 = exact, +1 = true score <= reported (fail low), -1 = true score >= reported (fail high)
+    results = [[moves[0], first_score, 0]]
+    rank_upper = 1 if maximizing_for_white else -1  # bound value that caps the rank key
+    for move, score in zip(moves[1:], sibling_scores):
+        results.append([move, score, 1 if score <= alpha else -1 if score >= beta else 0])
+
+    while True:
+        # Same tie order as the serial search: by score for the side to move, then by rank
+        results.sort(key=lambda r: r[1], reverse=maximizing_for_white)
+        results.sort(key=lambda r: rank_key(r[0], r[1]), reverse=True)
+        exact_keys = [rank_key(r[0], r[1]) for r in results if r[2] == 0]
+        cutoff = exact_keys[num_moves - 1] if len(exact_keys) >= num_moves else -inf
+        # Bounds are white-positive; in rank space (the mover's view) a fail low is
+        # an upper bound for White and a fail high one for Black. Upper bounds
+        # already below the cutoff can only fall further; anything else may rank
+        pending = [
+            r for r in results
+            if r[2] != 0 and (r[2] != rank_upper or rank_key(r[0], r[1]) >= cutoff)
+        ]
+        if not pending:
+            return [(r[0], r[1]) for r in results]
+        for r in pending:
+            r[1] = full_search(r[0])
+            r[2] = 0
+
+def get_best_moves(board, sos_scores=None, num_moves=3, depth=3, workers=None):
     """
     Gets the best moves for the current player using minimax.
     Returns a list of (move, score) tuples.
+    workers > 1 searches the final iteration's root moves in that many processes.
     """
 
     def opening_heuristic_adjustment(b, m):
@@ -262,20 +693,55 @@ def get_best_moves(board, sos_scores=None, num_moves=3, depth=3):
                 adj += 150
 
         return adj
-    best_moves = []
-    legal_moves = list(board.legal_moves)
+    reset_search_state(sos_scores)
 
-    maximizing_for_white = board.turn == chess.WHITE
+    # Resolve square-name lookups once; the search only indexes by square
+    sos = prepare_sos(sos_scores)
 
-    for move in legal_moves:
-        board.push(move)
-        # After push, it is opponent's turn, so flip maximizing flag
-        score = minimax(board, depth - 1, -float('inf'), float('inf'), not maximizing_for_white, sos_scores)
-        board.pop()
-        score += opening_heuristic_adjustment(board, move)
-        best_moves.append((move, score))
+    legal_moves = list(board.legal_moves)
 
-    # Sort moves by score, descending
-    best_moves.sort(key=lambda item: item[1], reverse=True)
+    maximizing_for_white = board.turn == chess.WHITE
+    # Scores are white-positive; rank them from the side to move's point of view
+    sign = 1 if maximizing_for_white else -1
+
+    # Deterministic first pass: last search's best move for this position (it is
+    # usually in the TT from the previous call), then captures by MVV-LVA.
+    entry = transposition_table.get(tt_key(board))
+    order_moves(board, legal_moves, entry[3] if entry is not None else None)
+
+    # Iterative deepening: each pass re-orders the root moves by the previous
+    # pass's scores and leaves TT entries/killers that make the next one cheaper.
+    final_depth = max(depth, 1)
+    for d in range(1, final_depth + 1):
+        if workers and workers > 1 and d == final_depth and len(legal_moves) > 1:
+            best_moves = search_root_parallel(
+                board, legal_moves, d, sos_scores,
+                lambda m, score: sign * score + opening_heuristic_adjustment(board, m), num_moves, workers,
+            )
+            break
+        best_moves = []
+        for move in legal_moves:
+            board.push(move)
+            # After push, it is opponent's turn, so flip maximizing flag
+            score = minimax(board, d - 1, -float('inf'), float('inf'), not maximizing_for_white, sos, 1)
+            board.pop()
+            best_moves.append((move, score))
+        best_moves.sort(key=lambda item: item[1], reverse=maximizing_for_white)
+        legal_moves = [move for move, _ in best_moves]
+
+    # Opening adjustments favour the mover, so they push Black's scores down
+    best_moves = [(move, score + sign * opening_heuristic_adjustment(board, move)) for move, score in best_moves]
+
+    # Best first for the side to move
+    best_moves.sort(key=lambda item: item[1], reverse=maximizing_for_white)
+
+    # Randomness only picks among moves tied for first; the search itself stays
+    # deterministic so repeated calls reuse the same TT entries.
+    if best_moves:
+        top = best_moves[0][1]
+        tied = [i for i, (_, score) in enumerate(best_moves) if score == top or abs(score - top) <= TIE_EPSILON]
+        if len(tied) > 1:
+            pick = random.choice(tied)
+            best_moves.insert(0, best_moves.pop(pick))
 
     return best_moves[:num_moves]
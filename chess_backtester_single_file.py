@@ -5,15 +5,18 @@ Chess-Framework Momentum Backtester (single-file version)
 Save this as `chess_backtester_single_file.py`.
 
 Dependencies:
-  pip install pandas numpy yfinance tqdm python-dateutil
+  pip install pandas numpy yfinance python-dateutil
+  Optional: numba (compiled day loop), bottleneck (faster rolling windows),
+            pyarrow (price cache, faster trades.csv writing), joblib (parallel --sweep)
 
 Usage:
   python chess_backtester_single_file.py
   python chess_backtester_single_file.py --config example_config.json
   python chess_backtester_single_file.py --tickers AAPL MSFT GOOGL --capital 100000 --risk Moderate
+  python chess_backtester_single_file.py --sweep risk_level=High,Moderate,Low ma_period=20,50
 
 Output:
-  - trades.csv written to the current directory
+  - trades.csv written to the current directory (trades_<hash>.csv per config with --sweep)
   - Console prints a short summary and piece inventory state
 
 Notes:
@@ -23,16 +26,35 @@ Notes:
 """
 
 import argparse
+import hashlib
+import itertools
 import json
 import os
-import uuid
-from datetime import datetime
-from collections import OrderedDict
+import time
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
-from tqdm import tqdm
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional; rolling windows fall back to pandas
+    bn = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; trades.csv is then written by pandas
+    pa = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # joblib is optional; --sweep then runs configs one after another
+    Parallel = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the day loop then runs as plain Python
+    njit = None
 
 # ---------------------------
 # Default config (in-file)
@@ -46,65 +68,153 @@ DEFAULT_CONFIG = {
     "start_date": None,
     "end_date": None,
     "reclaim_window_days": 3,
-    "max_positions": 8
+    "max_positions": 8,
+    "use_cache": True
 }
 
+# Downloaded price panels are cached here as parquet; an open-ended request
+# (no end date) is refreshed once the cached file is older than the TTL
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "chess_bt")
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
 # ---------------------------
 # SOS utilities (from sos.py)
 # ---------------------------
 
+def _normalize_rows(arr):
+    """Min-max normalize each row of a (T, N) array to 0..1; constant rows become 0.5."""
+    if arr.shape[1] == 0:
+        return arr.copy()
+    lo = arr.min(axis=1, keepdims=True)
+    hi = arr.max(axis=1, keepdims=True)
+    span = hi - lo
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = (arr - lo) / span
+    return np.where(span == 0, 0.5, scaled)
+
+def _rolling_mean(arr, window):
+    """Trailing mean over `window` rows of a (T, N) array; NaN until the window is full."""
+    if bn is not None:
+        return bn.move_mean(arr, window, min_count=window, axis=0)
+    return pd.DataFrame(arr).rolling(window=window, min_periods=window).mean().to_numpy()
+
+def _rolling_std(arr, window):
+    """Trailing sample standard deviation (ddof=1) over `window` rows of a (T, N) array."""
+    if bn is not None:
+        return bn.move_std(arr, window, min_count=window, axis=0, ddof=1)
+    return pd.DataFrame(arr).rolling(window=window, min_periods=window).std().to_numpy()
+
+def _price_metrics(price, window):
+    """
+    MA, return volatility and momentum of a (T, N) price array in one streaming
+    pass over its rows: running sums for the MA and a sliding Welford mean/M2
+    over daily returns (NaN returns count as 0), NaN until each window is full.
+    """
+    T, N = price.shape
+    ma = np.full((T, N), np.nan)
+    vol = np.full((T, N), np.nan)
+    mom = np.full((T, N), np.nan)
+    price_sum = np.zeros(N)
+    n_price = np.zeros(N, dtype=np.int64)
+    ret_mean = np.zeros(N)
+    ret_m2 = np.zeros(N)
+    n_ret = 0
+    for i in range(T):
+        # Every column has a return (possibly 0) on every row, so the count is shared
+        n_ret += 1
+        leaving = i >= window
+        if leaving:
+            n_ret -= 1
+        for j in range(N):
+            p = price[i, j]
+            if not np.isnan(p):
+                price_sum[j] += p
+                n_price[j] += 1
+            if leaving:
+                old = price[i - window, j]
+                if not np.isnan(old):
+                    price_sum[j] -= old
+                    n_price[j] -= 1
+            if n_price[j] == window:
+                ma[i, j] = price_sum[j] / window
+                mom[i, j] = p / ma[i, j] - 1.0
+
+            if window < 2:
+                continue  # sample std needs two returns; vol stays NaN
+            r = 0.0
+            if i > 0:
+                r = p / price[i - 1, j] - 1.0
+                if np.isnan(r):
+                    r = 0.0
+            if leaving:
+                # Drop the return leaving the window before adding today's
+                old = 0.0
+                if i - window > 0:
+                    old = price[i - window, j] / price[i - window - 1, j] - 1.0
+                    if np.isnan(old):
+                        old = 0.0
+                delta = old - ret_mean[j]
+                ret_mean[j] -= delta / (n_ret - 1)
+                ret_m2[j] -= delta * (old - ret_mean[j])
+            delta = r - ret_mean[j]
+            ret_mean[j] += delta / n_ret
+            ret_m2[j] += delta * (r - ret_mean[j])
+            if n_ret == window:
+                vol[i, j] = np.sqrt(max(ret_m2[j], 0.0) / (window - 1))
+    return ma, vol, mom
+
+_price_metrics_jit = njit(cache=True)(_price_metrics) if njit is not None else None
+
+def compute_sos_metrics(price_df, ma_period=50, weights=None):
+    """
+    Returns a dict of metric name -> (date x ticker) array, columns in price_df
+    order, for metrics: PRICE, MA, MOM, VOL, SOS
+    """
+    if weights is None:
+        weights = {"M": 0.6, "Vol": 0.25, "Lq": 0.15}
+    price_arr = price_df.to_numpy(dtype=np.float64)
+    if _price_metrics_jit is not None:
+        ma_arr, vol_arr, mom_arr = _price_metrics_jit(price_arr, ma_period)
+    else:
+        ma_arr = _rolling_mean(price_arr, ma_period)
+        returns = price_df.pct_change().to_numpy(dtype=np.float64)
+        returns = np.where(np.isnan(returns), 0.0, returns)
+        vol_arr = _rolling_std(returns, ma_period)
+        mom_arr = price_arr / ma_arr - 1.0
+
+    # SOS across tickers for every date at once: rows are dates, columns tickers
+    mom_score = _normalize_rows(np.where(np.isnan(mom_arr), 0.0, mom_arr))
+    # Volatility score: lower vol -> higher score
+    vol_score = 1.0 - _normalize_rows(np.where(np.isnan(vol_arr), 0.0, vol_arr))
+    # Liquidity placeholder (neutral)
+    lq_score = 0.5
+    sos_raw = weights["M"] * mom_score + weights["Vol"] * vol_score + weights["Lq"] * lq_score
+    sos = _normalize_rows(sos_raw)
+
+    return {
+        "PRICE": price_arr,
+        "MA": ma_arr,
+        "MOM": mom_arr,
+        "VOL": vol_arr,
+        "SOS": sos,
+    }
+
 def compute_sos_frame(price_df, ma_period=50, weights=None):
     """
     Returns a DataFrame with MultiIndex columns (ticker, metric) for metrics:
     PRICE, MA, MOM, VOL, SOS
     """
-    if weights is None:
-        weights = {"M": 0.6, "Vol": 0.25, "Lq": 0.15}
     tickers = price_df.columns.tolist()
-    ma = price_df.rolling(window=ma_period, min_periods=ma_period).mean()
-    returns = price_df.pct_change().fillna(0)
-    vol = returns.rolling(window=ma_period, min_periods=ma_period).std()
-
-    mom = price_df / ma - 1.0
-
-    out = pd.DataFrame(index=price_df.index)
-    for t in tickers:
-        out[(t, "PRICE")] = price_df[t]
-        out[(t, "MA")] = ma[t]
-        out[(t, "MOM")] = mom[t]
-        out[(t, "VOL")] = vol[t]
-        out[(t, "SOS")] = np.nan
-
-    out.columns = pd.MultiIndex.from_tuples(out.columns)
-
-    # Compute SOS per date across tickers
-    for date in price_df.index:
-        mom_raw = out.loc[date, pd.IndexSlice[:, "MOM"]].fillna(0)
-        vol_raw = out.loc[date, pd.IndexSlice[:, "VOL"]].fillna(0)
-        # Normalize mom to 0..1
-        if mom_raw.max() == mom_raw.min():
-            mom_score = pd.Series(0.5, index=mom_raw.index)
-        else:
-            mom_score = (mom_raw - mom_raw.min()) / (mom_raw.max() - mom_raw.min())
-        # Volatility score: lower vol -> higher score
-        if vol_raw.max() == vol_raw.min():
-            vol_score = pd.Series(0.5, index=vol_raw.index)
-        else:
-            vol_score = 1.0 - (vol_raw - vol_raw.min()) / (vol_raw.max() - vol_raw.min())
-        # Liquidity placeholder (neutral)
-        lq_score = pd.Series(0.5, index=mom_raw.index)
-
-        sos_raw = weights["M"] * mom_score + weights["Vol"] * vol_score + weights["Lq"] * lq_score
-        if sos_raw.max() == sos_raw.min():
-            sos_norm = pd.Series(0.5, index=sos_raw.index)
-        else:
-            sos_norm = (sos_raw - sos_raw.min()) / (sos_raw.max() - sos_raw.min())
-
-        for ticker_idx, t in enumerate(tickers):
-            out.at[date, (t, "SOS")] = sos_norm.iloc[ticker_idx]
-
-    out = out.reindex(sorted(out.columns), axis=1)
-    return out
+    metrics = compute_sos_metrics(price_df, ma_period=ma_period, weights=weights)
+    names = sorted(metrics)
+    # Columns sorted by (ticker, metric), as the per-ticker layout was before.
+    # Each metric is written straight into its slot of one preallocated buffer.
+    order = sorted(range(len(tickers)), key=lambda j: tickers[j])
+    data = np.empty((len(price_df.index), len(tickers), len(names)), dtype=np.float64)
+    for k, name in enumerate(names):
+        data[:, :, k] = metrics[name][:, order]
+    columns = pd.MultiIndex.from_product([[tickers[j] for j in order], names])
+    return pd.DataFrame(data.reshape(len(price_df.index), -1), index=price_df.index, columns=columns)
 
 def map_sos_to_rank(sos_value):
     r = 1 + int(np.floor((1.0 - float(sos_value)) * 8.0))
@@ -132,9 +242,14 @@ def map_sos_to_tile(sos_value):
 TOTAL_POINTS = 39  # per spec
 
 class PieceInventory:
+    """
+    The pieces as parallel arrays (type, PV, value, assigned); a piece's id
+    is its index, in Queen, Rook, Bishop, Knight, Pawn order. Pieces can also
+    be addressed by name ("Queen_0", "Pawn_14", ...).
+    """
+
     def __init__(self, momentum_capital):
         self.momentum_capital = float(momentum_capital)
-        self.pieces = []  # list of piece dicts: id,type,PV,value,assigned
         self._build_pieces()
 
     def _build_pieces(self):
@@ -146,88 +261,204 @@ class PieceInventory:
             ("Pawn", 1, 8)
         ]
         multiplier = self.momentum_capital / TOTAL_POINTS
-        idx = 0
-        for ptype, pv, qty in mapping:
-            for _ in range(qty):
-                piece = {
-                    "id": f"{ptype}_{idx}_{uuid.uuid4().hex[:6]}",
-                    "type": ptype,
-                    "PV": pv,
-                    "value": pv * multiplier,
-                    "assigned": False
-                }
-                self.pieces.append(piece)
-                idx += 1
+        self.type_names = [ptype for ptype, pv, qty in mapping]
+        # Per piece: index into type_names
+        self.type_code = np.repeat(np.arange(len(mapping)), [qty for ptype, pv, qty in mapping])
+        self.type = np.array(self.type_names)[self.type_code]
+        self.pv = np.array([pv for ptype, pv, qty in mapping for _ in range(qty)], dtype=np.int8)
+        self.value = self.pv * multiplier
+        self.assigned = np.zeros(len(self.pv), dtype=np.bool_)
+        self.ids = [f"{ptype}_{i}" for i, ptype in enumerate(self.type)]
+        self._by_id = {pid: i for i, pid in enumerate(self.ids)}
+        # Piece ids by PV, highest / lowest first (stable, so earlier ids win ties);
+        # selection walks these and takes the first unassigned piece
+        self.by_pv_desc = np.argsort(-self.pv, kind="stable")
+        self.by_pv_asc = np.argsort(self.pv, kind="stable")
 
     def summary(self):
-        s = {}
-        for p in self.pieces:
-            s.setdefault(p["type"], []).append(p)
-        out = {k: {"count": len(v), "assigned": sum(1 for x in v if x["assigned"])} for k, v in s.items()}
-        return out
+        n_types = len(self.type_names)
+        counts = np.bincount(self.type_code, minlength=n_types)
+        assigned = np.bincount(self.type_code, weights=self.assigned, minlength=n_types)
+        return {
+            ptype: {"count": int(count), "assigned": int(n_assigned)}
+            for ptype, count, n_assigned in zip(self.type_names, counts, assigned)
+        }
 
     def get_best_piece_for_rank(self, rank):
-        unassigned = [p for p in self.pieces if not p["assigned"]]
-        if not unassigned:
-            return None
-        best = sorted(unassigned, key=lambda x: -x["PV"])[0]
-        return best
+        """Id of the highest-PV unassigned piece (first on ties), or None."""
+        free = self.by_pv_desc[~self.assigned[self.by_pv_desc]]
+        return int(free[0]) if len(free) else None
 
     def get_tactical_piece(self):
-        unassigned = [p for p in self.pieces if not p["assigned"]]
-        if not unassigned:
-            return None
-        smallest = sorted(unassigned, key=lambda x: x["PV"])[0]
-        return smallest
+        """Id of the smallest-PV unassigned piece (first on ties), or None."""
+        free = self.by_pv_asc[~self.assigned[self.by_pv_asc]]
+        return int(free[0]) if len(free) else None
+
+    def _index(self, piece_id):
+        """Array index for a piece index or name; None if there is no such piece."""
+        if isinstance(piece_id, str):
+            return self._by_id.get(piece_id)
+        return piece_id if 0 <= piece_id < len(self.assigned) else None
 
     def assign_piece(self, piece_id):
-        for p in self.pieces:
-            if p["id"] == piece_id:
-                p["assigned"] = True
-                return True
-        return False
+        i = self._index(piece_id)
+        if i is None:
+            return False
+        self.assigned[i] = True
+        return True
 
     def recycle_piece(self, piece_id, returned_value):
-        for p in self.pieces:
-            if p["id"] == piece_id:
-                p["assigned"] = False
-                return True
-        return False
+        i = self._index(piece_id)
+        if i is None:
+            return False
+        self.assigned[i] = False
+        return True
 
 class TradeBook:
-    def __init__(self):
-        self.trades = []
+    """
+    Trades as preallocated typed columns; tickers, actions, dates and reasons
+    are stored as codes and mapped back to strings in to_frame. Columns grow
+    by doubling when full.
+    """
 
-    def record_trade(self, trade_dict):
-        self.trades.append(trade_dict)
+    def __init__(self, tickers, dates, capacity=1024):
+        self.tickers = np.asarray(tickers, dtype=object)
+        self.dates = pd.DatetimeIndex(dates)
+        self.n = 0
+        self.ticker_idx = np.empty(capacity, dtype=np.int32)
+        self.action = np.empty(capacity, dtype=np.int8)
+        self.price = np.empty(capacity, dtype=np.float64)
+        self.shares = np.empty(capacity, dtype=np.int64)
+        self.opened_idx = np.empty(capacity, dtype=np.int32)
+        self.closed_idx = np.empty(capacity, dtype=np.int32)
+        self.reason_code = np.empty(capacity, dtype=np.int8)
+        self.tactical = np.empty(capacity, dtype=np.bool_)
+
+    _COLUMNS = ("ticker_idx", "action", "price", "shares", "opened_idx", "closed_idx", "reason_code", "tactical")
+
+    def _reserve(self, extra):
+        needed = self.n + extra
+        capacity = len(self.action)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self.n] = old[:self.n]
+            setattr(self, name, grown)
+
+    def record_trade(self, ticker_idx, action, price, shares, opened_idx, closed_idx, reason_code, tactical):
+        """Append one trade; closed_idx is -1 for buys."""
+        self._reserve(1)
+        i = self.n
+        self.ticker_idx[i] = ticker_idx
+        self.action[i] = action
+        self.price[i] = price
+        self.shares[i] = shares
+        self.opened_idx[i] = opened_idx
+        self.closed_idx[i] = closed_idx
+        self.reason_code[i] = reason_code
+        self.tactical[i] = tactical
+        self.n += 1
+
+    def record_trades(self, ticker_idx, action, price, shares, opened_idx, closed_idx, reason_code, tactical):
+        """Append a batch of trades given as parallel arrays (same order as record_trade)."""
+        batch = (ticker_idx, action, price, shares, opened_idx, closed_idx, reason_code, tactical)
+        k = len(action)
+        self._reserve(k)
+        for name, values in zip(self._COLUMNS, batch):
+            getattr(self, name)[self.n:self.n + k] = values
+        self.n += k
 
     def to_frame(self):
-        return pd.DataFrame(self.trades)
+        n = self.n
+        if n == 0:
+            return pd.DataFrame()
+        opened = self.opened_idx[:n]
+        closed = self.closed_idx[:n]
+        # Format only the dates trades refer to, in one vectorized strftime;
+        # closed_idx -1 (buys) picks the trailing "" in date_str
+        used = np.unique(np.concatenate([opened, closed[closed >= 0]]))
+        date_str = np.full(len(self.dates) + 1, "", dtype=object)
+        date_str[used] = self.dates[used].strftime("%Y-%m-%d")
+        price = self.price[:n]
+        shares = self.shares[:n]
+        tactical = self.tactical[:n]
+        return pd.DataFrame({
+            "ticker": self.tickers[self.ticker_idx[:n]],
+            "action": np.array(["BUY", "SELL"], dtype=object)[self.action[:n]],
+            "price": price,
+            "shares": shares,
+            "value": price * shares,
+            "opened_date": date_str[opened],
+            "closed_date": date_str[closed],
+            "reason": np.array(TRADE_REASONS, dtype=object)[self.reason_code[:n]],
+            "initiated_on_square": np.where(tactical, "black", "white").astype(object),
+            "tactical": tactical,
+        })
 
     def summary(self):
-        df = self.to_frame()
-        if df.empty:
+        n = self.n
+        if n == 0:
             return "No trades recorded"
-        buys = df[df["action"]=="BUY"] if "action" in df.columns else df
-        sells = df[df["action"]=="SELL"] if "action" in df.columns else df
-        realized = sells["value"].sum() - buys["value"].sum()
-        ntrades = len(sells)
+        sells = self.action[:n] == ACTION_SELL
+        value = self.price[:n] * self.shares[:n]
+        realized = value[sells].sum() - value[~sells].sum()
+        n_sells = int(sells.sum())
         return {
-            "n_trades": int(ntrades),
+            "n_trades": n_sells,
             "realized_P&L": float(realized),
-            "buys": int(len(buys)),
-            "sells": int(len(sells))
+            "buys": n - n_sells,
+            "sells": n_sells
         }
 
 # ---------------------------
 # Data download helper
 # ---------------------------
 
-def download_data(tickers, start=None, end=None):
+def _cache_path(tickers, start, end):
+    key = hashlib.sha1(json.dumps([sorted(tickers), start, end]).encode()).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"{key}.parquet")
+
+def _cache_is_fresh(path, end):
+    mtime = os.path.getmtime(path)
+    if time.time() - mtime < CACHE_TTL_SECONDS:
+        return True
+    # A fixed end date that had already passed when the file was written won't change
+    return end is not None and pd.Timestamp(end) <= pd.Timestamp(mtime, unit="s").normalize()
+
+def download_data(tickers, start=None, end=None, use_cache=True):
     """
     Downloads adjusted close prices using yfinance for the given tickers and date range.
-    Returns DataFrame indexed by date with columns = tickers.
+    Returns DataFrame indexed by date with columns = tickers. With use_cache, a
+    fresh parquet copy under CACHE_DIR is used instead of the network (needs a
+    parquet engine such as pyarrow; without one every call downloads).
     """
+    path = _cache_path(tickers, start, end)
+    if use_cache and os.path.exists(path) and _cache_is_fresh(path, end):
+        try:
+            return pd.read_parquet(path).reindex(columns=tickers)
+        except ImportError:  # no parquet engine
+            pass
+    price = _download_prices(tickers, start, end)
+    if use_cache:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # Written under a temporary name and renamed, so parallel sweep
+            # workers never read a half-written file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            price.to_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, path)
+        except ImportError:  # no parquet engine; run uncached
+            pass
+    return price
+
+def _download_prices(tickers, start, end):
+    # Imported here: yfinance pulls in requests/lxml and is only needed on a cache miss
+    import yfinance as yf
+
     df = yf.download(tickers, start=start, end=end, progress=False, auto_adjust=False)
     if df.empty:
         raise RuntimeError("yfinance returned no data. Check internet, tickers, or date range.")
@@ -239,11 +470,194 @@ def download_data(tickers, start=None, end=None):
     price = price.reindex(columns=tickers)
     return price
 
+# ---------------------------
+# Day loop (compiled with numba when available)
+# ---------------------------
+
+# Trade reason codes produced by the day loop, indexing TRADE_REASONS
+TRADE_REASONS = ("black_flip_stoploss", "tactical_reclaim_failed", "end_of_sim", "deploy_on_white", "tactical_black_entry")
+REASON_STOPLOSS = 0
+REASON_RECLAIM_FAILED = 1
+REASON_END_OF_SIM = 2
+REASON_DEPLOY_WHITE = 3
+REASON_TACTICAL_ENTRY = 4
+ACTION_BUY = 0
+ACTION_SELL = 1
+
+def _first_valid(arr):
+    """Per column, the first row that is not NaN (len(arr) for all-NaN columns)."""
+    present = ~np.isnan(arr)
+    return np.where(present.any(axis=0), present.argmax(axis=0), len(arr)).astype(np.int64)
+
+def _run_days(prices, ma, sos, ready, price_from, watch_from, day_num, start, cand_cols,
+              by_pv_desc, by_pv_asc, piece_value, assigned, max_positions, reclaim_window):
+    """
+    Simulate days start..T-2 over (date x ticker) arrays, then close what is left
+    at the last price. ready[i, j] is True where price, MA and SOS are all
+    present, i.e. the ticker can be screened on that day. NaNs in the ffilled
+    panel are leading only, so price_from[j] is the first row with a price and
+    watch_from[j] the first with both price and MA. day_num holds each date as whole days since the epoch.
+    cand_cols lists the tradable columns in ticker-name order.
+    Pieces are parallel arrays, with their ids pre-sorted by PV in by_pv_desc /
+    by_pv_asc; `assigned` is updated in place. Positions are
+    walked in the order they were opened. Returns the trades as parallel arrays:
+    (col, action, price, shares, opened_idx, closed_idx, reason, tactical), with
+    closed_idx -1 on buys.
+    """
+    T, N = prices.shape
+    n_pieces = piece_value.shape[0]
+
+    # Open positions by column; opened == -1 means no position
+    shares = np.zeros(N, dtype=np.int64)
+    opened = np.full(N, -1, dtype=np.int64)
+    piece_of = np.full(N, -1, dtype=np.int64)
+    tactical = np.zeros(N, dtype=np.bool_)
+    reclaimed = np.zeros(N, dtype=np.bool_)
+    open_order = np.empty(N, dtype=np.int64)
+    n_open = 0
+
+    # Never more than min(max_positions, pieces, tickers) buys per day, each sold once
+    per_day = max(min(max_positions, n_pieces, N), 0)
+    cap = 2 * max(T - 1 - start, 0) * per_day + 1
+    tr_col = np.empty(cap, dtype=np.int64)
+    tr_action = np.empty(cap, dtype=np.int64)
+    tr_price = np.empty(cap, dtype=np.float64)
+    tr_shares = np.empty(cap, dtype=np.int64)
+    tr_opened = np.empty(cap, dtype=np.int64)
+    tr_closed = np.empty(cap, dtype=np.int64)
+    tr_reason = np.empty(cap, dtype=np.int64)
+    tr_tactical = np.empty(cap, dtype=np.bool_)
+    n_tr = 0
+
+    to_close = np.empty(N, dtype=np.int64)
+    close_reason = np.empty(N, dtype=np.int64)
+    cand = np.empty(cand_cols.shape[0], dtype=np.int64)
+    cand_key = np.empty(cand_cols.shape[0], dtype=np.float64)
+
+    for i in range(start, T - 1):
+        # 1) Check existing positions for stop-loss/retreats
+        n_close = 0
+        for k in range(n_open):
+            j = open_order[k]
+            if i < watch_from[j]:
+                continue
+            on_white = prices[i, j] > ma[i, j]
+            if tactical[j]:
+                days_since = day_num[i] - day_num[opened[j]]
+                if on_white:
+                    reclaimed[j] = True
+                elif days_since >= reclaim_window and not reclaimed[j]:
+                    to_close[n_close] = j
+                    close_reason[n_close] = REASON_RECLAIM_FAILED
+                    n_close += 1
+            elif not on_white:
+                # Non-tactical positions are only ever opened on white
+                to_close[n_close] = j
+                close_reason[n_close] = REASON_STOPLOSS
+                n_close += 1
+
+        # Execute closes at next day's prices
+        for c in range(n_close):
+            j = to_close[c]
+            if i + 1 < price_from[j]:
+                continue
+            exec_price = prices[i + 1, j]
+            tr_col[n_tr] = j
+            tr_action[n_tr] = ACTION_SELL
+            tr_price[n_tr] = exec_price
+            tr_shares[n_tr] = shares[j]
+            tr_opened[n_tr] = opened[j]
+            tr_closed[n_tr] = i + 1
+            tr_reason[n_tr] = close_reason[c]
+            tr_tactical[n_tr] = tactical[j]
+            n_tr += 1
+            assigned[piece_of[j]] = False
+            opened[j] = -1
+            k = 0
+            while open_order[k] != j:
+                k += 1
+            for kk in range(k, n_open - 1):
+                open_order[kk] = open_order[kk + 1]
+            n_open -= 1
+
+        # 2) Deploy new pieces, highest SOS first (ties by ticker name)
+        slots = max_positions - n_open
+        if slots <= 0:
+            continue
+        nc = 0
+        for j in cand_cols:
+            if opened[j] >= 0 or not ready[i, j]:
+                continue
+            cand[nc] = j
+            cand_key[nc] = -sos[i, j]
+            nc += 1
+        order = np.argsort(cand_key[:nc], kind="mergesort")
+        for o in order:
+            if slots <= 0:
+                break
+            j = cand[o]
+            on_white = prices[i, j] > ma[i, j]
+            # White squares take the highest-PV free piece, black the smallest
+            piece_order = by_pv_desc if on_white else by_pv_asc
+            p = -1
+            for q in piece_order:
+                if not assigned[q]:
+                    p = q
+                    break
+            if p < 0:
+                continue
+            entry_price = prices[i + 1, j]
+            if i + 1 < price_from[j] or entry_price <= 0:
+                continue
+            n_shares = int(piece_value[p] // entry_price)
+            if n_shares <= 0:
+                continue
+            shares[j] = n_shares
+            opened[j] = i
+            piece_of[j] = p
+            tactical[j] = not on_white
+            reclaimed[j] = False
+            open_order[n_open] = j
+            n_open += 1
+            assigned[p] = True
+            tr_col[n_tr] = j
+            tr_action[n_tr] = ACTION_BUY
+            tr_price[n_tr] = entry_price
+            tr_shares[n_tr] = n_shares
+            tr_opened[n_tr] = i + 1
+            tr_closed[n_tr] = -1
+            tr_reason[n_tr] = REASON_DEPLOY_WHITE if on_white else REASON_TACTICAL_ENTRY
+            tr_tactical[n_tr] = not on_white
+            n_tr += 1
+            slots -= 1
+
+    # Close any remaining positions at last price
+    for k in range(n_open):
+        j = open_order[k]
+        if T - 1 < price_from[j]:
+            continue
+        exec_price = prices[T - 1, j]
+        tr_col[n_tr] = j
+        tr_action[n_tr] = ACTION_SELL
+        tr_price[n_tr] = exec_price
+        tr_shares[n_tr] = shares[j]
+        tr_opened[n_tr] = opened[j]
+        tr_closed[n_tr] = T - 1
+        tr_reason[n_tr] = REASON_END_OF_SIM
+        tr_tactical[n_tr] = tactical[j]
+        n_tr += 1
+        assigned[piece_of[j]] = False
+
+    return (tr_col[:n_tr], tr_action[:n_tr], tr_price[:n_tr], tr_shares[:n_tr],
+            tr_opened[:n_tr], tr_closed[:n_tr], tr_reason[:n_tr], tr_tactical[:n_tr])
+
+_run_days_jit = njit(cache=True)(_run_days) if njit is not None else None
+
 # ---------------------------
 # Backtester (integrated)
 # ---------------------------
 
-def run_backtest(cfg):
+def run_backtest(cfg, trades_path="trades.csv"):
     tickers = cfg["tickers"]
     total_capital = float(cfg["total_capital"])
     risk_level = cfg["risk_level"]
@@ -257,7 +671,6 @@ def run_backtest(cfg):
     king_cash = total_capital - momentum_capital
 
     piece_inventory = PieceInventory(momentum_capital)
-    tradebook = TradeBook()
 
     # Data window
     if cfg["start_date"] is None:
@@ -266,7 +679,7 @@ def run_backtest(cfg):
         start = cfg["start_date"]
     end = cfg["end_date"]
 
-    price_panel = download_data(tickers, start, end)
+    price_panel = download_data(tickers, start, end, use_cache=cfg["use_cache"])
     price_panel = price_panel.dropna(how='all')
     price_panel = price_panel.ffill().dropna(axis=1, how="any")
     dates = price_panel.index
@@ -274,184 +687,115 @@ def run_backtest(cfg):
     if len(dates) < ma_period + 2:
         raise RuntimeError("Not enough data to compute MA with the selected period. Try shorter MA or a longer history.")
 
-    # Compute SOS frame
-    sos_df = compute_sos_frame(price_panel, ma_period=ma_period)
-
-    positions = {}  # ticker -> position dict
-
-    for i in tqdm(range(ma_period, len(dates)-1), desc="Backtest days"):
-        today = dates[i]
-        tomorrow = dates[i+1]
-        day_prices = price_panel.loc[today]
-        next_prices = price_panel.loc[tomorrow]
-
-        sos_today = sos_df.loc[today]
-
-        # 1) Check existing positions for stop-loss/retreats
-        to_close = []
-        for ticker, pos in list(positions.items()):
-            price = day_prices.get(ticker, np.nan)
-            ma = sos_today.get((ticker, "MA"), np.nan)
-            if pd.isna(price) or pd.isna(ma):
-                continue
-            was_initiated_on = pos["initiated_on_square"]
-            current_square = "white" if price > ma else "black"
-
-            if pos.get("tactical_black", False):
-                days_since = (pd.Timestamp(today) - pd.Timestamp(pos["opened_date"])).days
-                if current_square == "white":
-                    pos["tactical_reclaimed"] = True
-                elif days_since >= reclaim_window and not pos.get("tactical_reclaimed", False):
-                    to_close.append((ticker, "tactical_reclaim_failed"))
-            else:
-                if was_initiated_on == "white" and current_square == "black":
-                    to_close.append((ticker, "black_flip_stoploss"))
-
-        # Execute closes at next_prices
-        for ticker, reason in to_close:
-            if ticker not in positions:
-                continue
-            exec_price = next_prices.get(ticker, np.nan)
-            if pd.isna(exec_price):
-                continue
-            pos = positions.pop(ticker)
-            tradebook.record_trade({
-                "ticker": ticker,
-                "action": "SELL",
-                "price": float(exec_price),
-                "shares": pos["shares"],
-                "value": float(exec_price*pos["shares"]),
-                "opened_date": pos["opened_date"].strftime("%Y-%m-%d") if hasattr(pos["opened_date"], "strftime") else str(pos["opened_date"]),
-                "closed_date": pd.Timestamp(tomorrow).strftime("%Y-%m-%d"),
-                "reason": reason,
-                "initiated_on_square": pos["initiated_on_square"],
-                "tactical": pos.get("tactical_black", False)
-            })
-            piece_inventory.recycle_piece(pos["piece_id"], float(exec_price*pos["shares"]))
-
-        # 2) Deploy new pieces
-        available_slots = max_positions - len(positions)
-        if available_slots > 0:
-            cand = []
-            for ticker in tickers:
-                if ticker in positions:
-                    continue
-                price = day_prices.get(ticker, np.nan)
-                ma = sos_today.get((ticker, "MA"), np.nan)
-                sos_val = sos_today.get((ticker, "SOS"), np.nan)
-                if pd.isna(price) or pd.isna(ma) or pd.isna(sos_val):
-                    continue
-                square = "white" if price > ma else "black"
-                cand.append((float(sos_val), ticker, square))
-            if cand:
-                cand_sorted = sorted(cand, key=lambda x: (-x[0], x[1]))
-                for sos_val, ticker, square in cand_sorted:
-                    if available_slots <= 0:
-                        break
-                    if square == "white":
-                        rank, file = map_sos_to_tile(sos_val)
-                        piece = piece_inventory.get_best_piece_for_rank(rank)
-                        if piece is None:
-                            continue
-                        entry_price = next_prices.get(ticker, np.nan)
-                        if pd.isna(entry_price) or entry_price <= 0:
-                            continue
-                        shares = int(piece["value"] // entry_price)
-                        if shares <= 0:
-                            continue
-                        positions[ticker] = {
-                            "shares": shares,
-                            "avg_entry": float(entry_price),
-                            "opened_date": today,
-                            "piece_id": piece["id"],
-                            "piece_type": piece["type"],
-                            "initiated_on_square": "white",
-                            "tactical_black": False
-                        }
-                        piece_inventory.assign_piece(piece["id"])
-                        tradebook.record_trade({
-                            "ticker": ticker,
-                            "action": "BUY",
-                            "price": float(entry_price),
-                            "shares": shares,
-                            "value": float(entry_price*shares),
-                            "opened_date": pd.Timestamp(tomorrow).strftime("%Y-%m-%d"),
-                            "closed_date": "",
-                            "reason": "deploy_on_white",
-                            "initiated_on_square": "white",
-                            "tactical": False
-                        })
-                        available_slots -= 1
-
-                    elif square == "black":
-                        tactical_piece = piece_inventory.get_tactical_piece()
-                        if tactical_piece is None:
-                            continue
-                        entry_price = next_prices.get(ticker, np.nan)
-                        if pd.isna(entry_price) or entry_price <= 0:
-                            continue
-                        shares = int(tactical_piece["value"] // entry_price)
-                        if shares <= 0:
-                            continue
-                        positions[ticker] = {
-                            "shares": shares,
-                            "avg_entry": float(entry_price),
-                            "opened_date": today,
-                            "piece_id": tactical_piece["id"],
-                            "piece_type": tactical_piece["type"],
-                            "initiated_on_square": "black",
-                            "tactical_black": True,
-                            "tactical_reclaimed": False
-                        }
-                        piece_inventory.assign_piece(tactical_piece["id"])
-                        tradebook.record_trade({
-                            "ticker": ticker,
-                            "action": "BUY",
-                            "price": float(entry_price),
-                            "shares": shares,
-                            "value": float(entry_price*shares),
-                            "opened_date": pd.Timestamp(tomorrow).strftime("%Y-%m-%d"),
-                            "closed_date": "",
-                            "reason": "tactical_black_entry",
-                            "initiated_on_square": "black",
-                            "tactical": True
-                        })
-                        available_slots -= 1
-
-    # Close any remaining positions at last price
-    last_date = dates[-1]
-    last_prices = price_panel.loc[last_date]
-    for ticker, pos in list(positions.items()):
-        exec_price = last_prices.get(ticker, np.nan)
-        if pd.isna(exec_price):
-            continue
-        tradebook.record_trade({
-            "ticker": ticker,
-            "action": "SELL",
-            "price": float(exec_price),
-            "shares": pos["shares"],
-            "value": float(exec_price*pos["shares"]),
-            "opened_date": pos["opened_date"].strftime("%Y-%m-%d") if hasattr(pos["opened_date"], "strftime") else str(pos["opened_date"]),
-            "closed_date": pd.Timestamp(last_date).strftime("%Y-%m-%d"),
-            "reason": "end_of_sim",
-            "initiated_on_square": pos["initiated_on_square"],
-            "tactical": pos.get("tactical_black", False)
-        })
-        piece_inventory.recycle_piece(pos["piece_id"], float(exec_price*pos["shares"]))
-        positions.pop(ticker, None)
+    # SOS metrics as plain (date x ticker) arrays in panel column order; the day
+    # loop reads rows of these and never needs the (ticker, metric) frame
+    metrics = compute_sos_metrics(price_panel, ma_period=ma_period)
+    panel_tickers = price_panel.columns.tolist()
+    price_arr = metrics["PRICE"]
+    ma_arr = metrics["MA"]
+    sos_arr = metrics["SOS"]
+    ticker_col = {t: j for j, t in enumerate(panel_tickers)}
+    # Tradable tickers in name order, the tie-break for equal SOS
+    cand_cols = np.array([ticker_col[t] for t in sorted(set(tickers)) if t in ticker_col], dtype=np.int64)
+    # Screening mask for every day at once, instead of three NaN tests per ticker per day
+    ready = ~(np.isnan(price_arr) | np.isnan(ma_arr) | np.isnan(sos_arr))
+    price_from = _first_valid(price_arr)
+    watch_from = np.maximum(price_from, _first_valid(ma_arr))
+    # Calendar day numbers, so holding periods are plain int differences
+    day_num = dates.values.astype("datetime64[D]").view(np.int64)
+
+    # The kernel assigns and recycles pieces directly in the inventory's arrays
+    run_days = _run_days_jit if _run_days_jit is not None else _run_days
+    cols, actions, prices, shares, opened_idx, closed_idx, reasons, tactical = run_days(
+        price_arr, ma_arr, sos_arr, ready, price_from, watch_from, day_num, ma_period, cand_cols,
+        piece_inventory.by_pv_desc, piece_inventory.by_pv_asc, piece_inventory.value, piece_inventory.assigned,
+        max_positions, reclaim_window,
+    )
+
+    tradebook = TradeBook(panel_tickers, dates)
+    tradebook.record_trades(cols, actions, prices, shares, opened_idx, closed_idx, reasons, tactical)
 
     trades_df = tradebook.to_frame()
-    trades_df.to_csv("trades.csv", index=False)
-    print("Trades written to trades.csv")
+    write_trades_csv(trades_df, trades_path)
+    print(f"Trades written to {trades_path}")
     print("Piece inventory final state:")
     print(json.dumps(piece_inventory.summary(), indent=2))
     print("Trade summary:")
     print(tradebook.summary())
+    return tradebook
+
+def write_trades_csv(trades_df, path):
+    """
+    Write the trades frame as CSV, through pyarrow's C++ writer when available.
+    The output matches DataFrame.to_csv(index=False): nothing is quoted and
+    booleans are True/False. Values that would need quoting (a comma, say)
+    make pyarrow refuse, and the frame is written by pandas instead.
+    """
+    if pa is None or trades_df.empty:
+        trades_df.to_csv(path, index=False)
+        return
+    table = pa.Table.from_pandas(trades_df, preserve_index=False)
+    for k, field in enumerate(table.schema):
+        if pa.types.is_boolean(field.type):
+            as_text = np.where(trades_df[field.name].to_numpy(), "True", "False")
+            table = table.set_column(k, field.name, pa.array(as_text))
+    buf = pa.BufferOutputStream()
+    try:
+        pacsv.write_csv(table, buf, pacsv.WriteOptions(include_header=False, quoting_style="none"))
+    except pa.ArrowInvalid:
+        trades_df.to_csv(path, index=False)
+        return
+    # pyarrow always quotes its header line, so the header is written here
+    with open(path, "wb") as f:
+        f.write((",".join(trades_df.columns) + "\n").encode())
+        f.write(buf.getvalue())
 
 # ---------------------------
 # CLI & helpers
 # ---------------------------
 
+def parse_sweep(specs):
+    """
+    Parse ["risk_level=High,Low", "ma_period=20,50"] into {key: [values]}. Values
+    are read as JSON where possible (numbers, true/false), otherwise as strings.
+    """
+    grid = {}
+    for spec in specs:
+        key, sep, values = spec.partition("=")
+        if not sep or key not in DEFAULT_CONFIG:
+            raise ValueError(f"Bad sweep spec {spec!r}; expected KEY=V1,V2 with KEY one of {sorted(DEFAULT_CONFIG)}")
+        parsed = []
+        for v in values.split(","):
+            try:
+                parsed.append(json.loads(v))
+            except json.JSONDecodeError:
+                parsed.append(v)
+        grid[key] = parsed
+    return grid
+
+def sweep_configs(base_cfg, grid):
+    """One config per point of the grid's cartesian product, over base_cfg."""
+    keys = list(grid)
+    return [dict(base_cfg, **dict(zip(keys, point))) for point in itertools.product(*(grid[k] for k in keys))]
+
+def config_hash(cfg):
+    return hashlib.sha1(json.dumps(cfg, sort_keys=True).encode()).hexdigest()[:10]
+
+def run_sweep(configs, n_jobs=-1):
+    """
+    Run independent backtests, in parallel worker processes when joblib is
+    installed. Each writes trades_<config hash>.csv; returns the tradebooks.
+    """
+    paths = [f"trades_{config_hash(cfg)}.csv" for cfg in configs]
+    if Parallel is None:
+        tradebooks = [run_backtest(cfg, path) for cfg, path in zip(configs, paths)]
+    else:
+        tradebooks = Parallel(n_jobs=n_jobs)(delayed(run_backtest)(cfg, path) for cfg, path in zip(configs, paths))
+    print("Sweep results:")
+    for cfg, path, tradebook in zip(configs, paths, tradebooks):
+        print(f"{path}: {tradebook.summary()}")
+    return tradebooks
+
 def load_config(path):
     with open(path, "r") as f:
         cfg = json.load(f)
@@ -467,6 +811,9 @@ def parse_args():
     p.add_argument("--risk", choices=["High", "Moderate", "Low"], help="Risk level override")
     p.add_argument("--start", help="Start date (YYYY-MM-DD)")
     p.add_argument("--end", help="End date (YYYY-MM-DD)")
+    p.add_argument("--sweep", nargs="+", metavar="KEY=V1,V2",
+                   help="Run one backtest per combination of config values, e.g. risk_level=High,Low ma_period=20,50")
+    p.add_argument("--no-cache", action="store_true", help="Always re-download prices instead of using the local cache")
     return p.parse_args()
 
 def main():
@@ -486,6 +833,15 @@ def main():
         cfg["start_date"] = args.start
     if args.end:
         cfg["end_date"] = args.end
+    if args.no_cache:
+        cfg["use_cache"] = False
+
+    if args.sweep:
+        configs = sweep_configs(cfg, parse_sweep(args.sweep))
+        print(f"Running sweep of {len(configs)} backtests over config:")
+        print(json.dumps(cfg, indent=2))
+        run_sweep(configs)
+        return
 
     print("Running backtest with config:")
     print(json.dumps(cfg, indent=2))
@@ -28,27 +28,32 @@ class InteractiveBoardSimulation:
     def run_backtest(self, start_date: str, end_date: str):
         """Run full backtest through historical data."""
         print(f"\nStarting backtest from {start_date} to {end_date}...")
-        self.trader.load_market_data(start_date, end_date)
-
-        if self.trader.price_data is None or self.trader.sos_data is None:
-            print("Error: Could not load market data")
-            return
-
-        dates = self.trader.price_data.index
-        starting_idx = self.trader.ma_period  # Start after MA computation
-
-        for date_idx in range(starting_idx, len(dates) - 1):
-            date = dates[date_idx]
-            self.trader.game_state.current_date = date
-
-            # Update board state
-            state = self.trader.get_current_board_state(date_idx)
-            if not state["tiles"]:
-                continue
-
-            # Get suggestions and process
-            suggestions = self.trader.get_suggestions()
-            self._process_day(date, state, suggestions)
+        # Quiet while stepping through the data; only the results are printed
+        verbose, self.trader.verbose = self.trader.verbose, False
+        try:
+            self.trader.load_market_data(start_date, end_date)
+
+            if self.trader.price_data is None or self.trader.sos_data is None:
+                print("Error: Could not load market data")
+                return
+
+            dates = self.trader.price_data.index
+            starting_idx = self.trader.ma_period  # Start after MA computation
+
+            for date_idx in range(starting_idx, len(dates) - 1):
+                date = dates[date_idx]
+                self.trader.game_state.current_date = date
+
+                # Update board state
+                state = self.trader.get_current_board_state(date_idx)
+                if not state["tiles"]:
+                    continue
+
+                # Get suggestions and process
+                suggestions = self.trader.get_suggestions()
+                self._process_day(date, state, suggestions)
+        finally:
+            self.trader.verbose = verbose
 
         self._print_backtest_results()
 
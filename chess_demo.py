@@ -4,6 +4,9 @@ Chess Framework Trading System - Comprehensive Example & Demo
 Demonstrates all features: setup, SOS scoring, board state, suggestions, and backtesting.
 """
 
+import argparse
+import cProfile
+
 from chess_framework import (
     ChessFrameworkTrader,
     RiskLevel,
@@ -11,8 +14,12 @@ from chess_framework import (
     GamePhase,
 )
 from chess_cli import InteractiveBoardSimulation
+import numpy as np
 import pandas as pd
 
+# Empty 8x8 board (rank 8 first), copied for each rendering
+EMPTY_BOARD = np.full((8, 8), ".", dtype="U1")
+
 
 def demo_basic_setup():
     """Demonstrate basic system setup."""
@@ -189,25 +196,20 @@ def demo_board_visualization(trader):
     print("   Legend: W = White square (BUY zone), B = Black square (SELL zone)")
     print()
 
-    # Build board
-    board = [["." for _ in range(8)] for _ in range(8)]
-
-    for ticker, tile in state["tiles"].items():
-        parts = tile["position"]
-        if len(parts) == 2:
-            file_char = parts[0]
-            rank = int(parts[1])
-            rank_idx = 8 - rank
-            file_idx = ord(file_char) - ord('A')
-            marker = "W" if tile["square"] == "white" else "B"
-            if 0 <= rank_idx < 8 and 0 <= file_idx < 8:
-                board[rank_idx][file_idx] = marker
-
-    print("     A B C D E F G H")
-    for i, row in enumerate(board):
-        rank = 8 - i
-        print(f"  {rank} {' '.join(row)}")
-    print()
+    # Build board: scatter every ticker's marker in one assignment
+    board = EMPTY_BOARD.copy()
+    tiles = [tile for tile in state["tiles"].values() if len(tile["position"]) == 2]
+    if tiles:
+        codes = np.frombuffer("".join(t["position"] for t in tiles).encode(), dtype=np.uint8)
+        codes = codes.reshape(-1, 2).astype(np.int64)
+        file_idx = codes[:, 0] - ord("A")
+        rank_idx = 8 - (codes[:, 1] - ord("0"))
+        markers = np.where([t["square"] == "white" for t in tiles], "W", "B")
+        on_board = (0 <= rank_idx) & (rank_idx < 8) & (0 <= file_idx) & (file_idx < 8)
+        board[rank_idx[on_board], file_idx[on_board]] = markers[on_board]
+
+    rows = "\n".join(f"  {8 - i} {' '.join(row)}" for i, row in enumerate(board))
+    print(f"     A B C D E F G H\n{rows}\n")
 
     print("📊 Game Phase: MIDDLEGAME (based on positions deployed)")
     print("   Transition rules:")
@@ -285,8 +287,31 @@ def demo_backtest_summary(trader):
     sim.run_backtest("2023-01-01", "2023-12-31")
 
 
+def parse_args():
+    p = argparse.ArgumentParser()
+    p.add_argument("--noninteractive", action="store_true",
+                   help="Run every demo straight through without 'Press Enter' pauses")
+    p.add_argument("--profile", action="store_true",
+                   help="Profile the run with cProfile and write chess_demo.prof")
+    return p.parse_args()
+
+
 def main():
-    """Run all demos."""
+    args = parse_args()
+    pause = (lambda prompt: None) if args.noninteractive else input
+    if args.profile:
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(run_demos, pause)
+        finally:
+            profiler.dump_stats("chess_demo.prof")
+            print("\nProfile written to chess_demo.prof")
+    else:
+        run_demos(pause)
+
+
+def run_demos(pause=input):
+    """Run all demos, calling pause(prompt) between them."""
     print("\n" + "="*80)
     print("CHESS FRAMEWORK TRADING SYSTEM - COMPREHENSIVE DEMO")
     print("="*80)
@@ -295,22 +320,22 @@ def main():
 
     # Run demos
     trader = demo_basic_setup()
-    input("\nPress Enter to continue to Demo 2...")
+    pause("\nPress Enter to continue to Demo 2...")
 
     demo_piece_inventory(trader)
-    input("\nPress Enter to continue to Demo 3...")
+    pause("\nPress Enter to continue to Demo 3...")
 
     demo_sos_scoring(trader)
-    input("\nPress Enter to continue to Demo 4...")
+    pause("\nPress Enter to continue to Demo 4...")
 
     demo_move_suggestions(trader)
-    input("\nPress Enter to continue to Demo 5...")
+    pause("\nPress Enter to continue to Demo 5...")
 
     demo_board_visualization(trader)
-    input("\nPress Enter to continue to Demo 6...")
+    pause("\nPress Enter to continue to Demo 6...")
 
     demo_rules_enforcement(trader)
-    input("\nPress Enter to continue to Demo 7 (full backtest)...")
+    pause("\nPress Enter to continue to Demo 7 (full backtest)...")
 
     print("\nRunning backtest... this may take a moment.")
     demo_backtest_summary(trader)
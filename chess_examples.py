@@ -4,15 +4,34 @@ Chess Framework - Usage Examples
 Practical code examples for common tasks
 """
 
+import functools
+
 from chess_framework import (
     ChessFrameworkTrader,
     RiskLevel,
     SOSScorer,
     PieceInventory,
     GamePhase,
+    fetch_prices,
 )
 from chess_cli import InteractiveBoardSimulation
-import pandas as pd
+
+
+# Every example that loads data draws from these tickers over 2023, so one
+# download serves them all
+EXAMPLE_TICKERS = ("AAPL", "MSFT", "GOOGL", "AMZN")
+EXAMPLE_START, EXAMPLE_END = "2023-01-01", "2023-12-31"
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_prices():
+    """Price panel for EXAMPLE_TICKERS over 2023, downloaded on first use."""
+    return fetch_prices(list(EXAMPLE_TICKERS), EXAMPLE_START, EXAMPLE_END)
+
+
+def _load(trader, start_date=EXAMPLE_START, end_date=EXAMPLE_END):
+    """load_market_data for an example trader, sliced from the shared panel."""
+    trader.load_market_data(start_date, end_date, prices=_shared_prices())
 
 
 # ============================================================================
@@ -79,7 +98,7 @@ def example_3_load_data():
     )
 
     print("📥 Loading 2023 data...")
-    trader.load_market_data("2023-01-01", "2023-12-31")
+    _load(trader)
 
     print(f"✅ Loaded {len(trader.price_data)} trading days")
     print(f"   Date range: {trader.price_data.index[0].date()} to {trader.price_data.index[-1].date()}")
@@ -104,7 +123,7 @@ def example_4_board_state():
         risk_level=RiskLevel.MODERATE,
     )
 
-    trader.load_market_data("2023-06-01", "2023-08-31")
+    _load(trader, "2023-06-01", "2023-08-31")
 
     # Get state at middle of data
     mid_idx = len(trader.price_data) // 2
@@ -136,7 +155,7 @@ def example_5_suggestions():
         risk_level=RiskLevel.HIGH,
     )
 
-    trader.load_market_data("2023-01-01", "2023-12-31")
+    _load(trader)
 
     # Get state at day 100 (after MA period)
     state = trader.get_current_board_state(100)
@@ -169,7 +188,7 @@ def example_6_rules():
         risk_level=RiskLevel.MODERATE,
     )
 
-    trader.load_market_data("2023-01-01", "2023-12-31")
+    _load(trader)
     state = trader.get_current_board_state(100)
 
     rules = trader.rules_engine
@@ -211,7 +230,7 @@ def example_7_sos_scoring():
         risk_level=RiskLevel.MODERATE,
     )
 
-    trader.load_market_data("2023-01-01", "2023-12-31")
+    _load(trader)
 
     # Get SOS data
     if trader.sos_data is not None:
@@ -223,14 +242,19 @@ def example_7_sos_scoring():
         print(f"{'Ticker':<10} {'MOM':<10} {'VOL':<10} {'SOS':<10} {'Rank':<6}")
         print("-" * 60)
 
-        for ticker in trader.tickers:
-            mom = trader.sos_data.loc[date, (ticker, "MOM")]
-            vol = trader.sos_data.loc[date, (ticker, "VOL")]
-            sos = trader.sos_data.loc[date, (ticker, "SOS")]
-
-            if not pd.isna(sos):
-                rank = SOSScorer.sos_to_rank(sos)
-                print(f"{ticker:<10} {mom:<10.3f} {vol:<10.3f} {sos:<10.3f} {rank:<6}")
+        # Per-metric (date x ticker) panels; ranks for every date in one call
+        mom_panel, vol_panel, sos_panel = (
+            trader.sos_data.xs(metric, axis=1, level=1)[trader.tickers].to_numpy()
+            for metric in ("MOM", "VOL", "SOS")
+        )
+        ranks = SOSScorer.sos_to_rank_array(sos_panel)
+
+        for ticker_idx, ticker in enumerate(trader.tickers):
+            mom = mom_panel[date_idx, ticker_idx]
+            vol = vol_panel[date_idx, ticker_idx]
+            sos = sos_panel[date_idx, ticker_idx]
+            rank = ranks[date_idx, ticker_idx]
+            print(f"{ticker:<10} {mom:<10.3f} {vol:<10.3f} {sos:<10.3f} {rank:<6}")
 
         print("-" * 60)
         print("\nFormula: SOS = 0.6 × Momentum + 0.25 × Volatility + 0.15 × Liquidity")
@@ -11,16 +11,29 @@ Core Philosophy:
 - Risk management is paramount (King's safety = capital preservation)
 """
 
+import hashlib
+import importlib.util
 import json
+import os
+import time
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Tuple
-import yfinance as yf
 from abc import ABC, abstractmethod
 
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional; rolling windows then use pandas
+    bn = None
+
+# numba is optional (rolling windows then use bottleneck or pandas). Like
+# yfinance it is slow to import, so it is only loaded once the first SOS
+# panel is computed
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
 
 # ============================================================================
 # ENUMS & CONSTANTS
@@ -62,6 +75,25 @@ class RiskLevel(Enum):
 
 TOTAL_POINTS = 39  # Total point value across all pieces
 
+# Downloaded prices (parquet) and derived SOS panels (npy) are cached here; a
+# file is reused while younger than the TTL, or forever once its end date had
+# already passed when it was written
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "chess_framework")
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Metric order of the stacked (n_metrics, n_dates, n_tickers) panel cache file
+PANEL_METRICS = ("PRICE", "MA", "MOM", "VOL", "SOS")
+
+# Minimum piece point value for a White square deployment, indexed by rank
+# (R.6, R.13); index 0 is unused
+_MIN_PV_BY_RANK = np.array([1, 1, 1, 3, 3, 5, 5, 9, 9], dtype=np.int8)
+_MIN_PV_MESSAGES = {
+    1: "requires at least Pawn (PV>=1)",
+    3: "requires at least Knight/Bishop (PV>=3)",
+    5: "requires at least Rook (PV>=5)",
+    9: "requires Queen (PV>=9)",
+}
+
 PIECE_CONFIG = [
     (PieceType.QUEEN, 1),
     (PieceType.ROOK, 2),
@@ -74,8 +106,10 @@ PIECE_CONFIG = [
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
+# Slotted: no per-instance __dict__, since tiles are rebuilt for every ticker
+# on every date and pieces/trades accumulate through a backtest.
 
-@dataclass
+@dataclass(slots=True)
 class Piece:
     """Represents a chess piece (trading position)."""
     piece_id: str
@@ -111,8 +145,18 @@ class Piece:
             return ((current_price - self.entry_price) / self.entry_price) * 100
         return 0.0
 
+    @staticmethod
+    def gain_loss_pct_many(pieces: List['Piece'], current_prices) -> np.ndarray:
+        """gain_loss_pct for several pieces at once, one current price per piece."""
+        entry = np.array([p.entry_price or 0.0 for p in pieces], dtype=np.float64)
+        current = np.asarray(current_prices, dtype=np.float64)
+        valid = entry > 0
+        pct = np.zeros(len(pieces))
+        pct[valid] = ((current[valid] - entry[valid]) / entry[valid]) * 100
+        return pct
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BoardPosition:
     """Represents an 8x8 chessboard position (Rank 1-8, File A-H)."""
     rank: int  # 1-8 (Risk level: 1=lowest, 8=highest)
@@ -136,7 +180,21 @@ class BoardPosition:
         return f"{self.file}{self.rank}"
 
 
-@dataclass
+# All 64 squares built once; board_position() hands out these shared instances
+_POSITIONS: Dict[Tuple[int, str], BoardPosition] = {
+    (rank, file): BoardPosition(rank, file) for rank in range(1, 9) for file in "ABCDEFGH"
+}
+
+
+def board_position(rank: int, file: str) -> BoardPosition:
+    """The interned BoardPosition for (rank, file); validates like the constructor."""
+    pos = _POSITIONS.get((rank, file))
+    if pos is None:
+        return BoardPosition(rank, file)  # raises ValueError for off-board squares
+    return pos
+
+
+@dataclass(slots=True)
 class StockTile:
     """Represents a stock on the board with technical metrics."""
     ticker: str
@@ -152,13 +210,13 @@ class StockTile:
 
     @property
     def position(self) -> BoardPosition:
-        return BoardPosition(self.rank, self.file)
+        return board_position(self.rank, self.file)
 
     def __str__(self) -> str:
         return f"{self.ticker} @ ${self.current_price:.2f} (MA: ${self.moving_average:.2f}) - {self.square_color.value.upper()}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Records a trade execution."""
     trade_id: str
@@ -199,6 +257,7 @@ class PieceInventory:
     def __init__(self, momentum_capital: float):
         self.momentum_capital = float(momentum_capital)
         self.pieces: List[Piece] = []
+        self._by_id: Dict[str, Piece] = {}
         self._build_pieces()
 
     def _build_pieces(self):
@@ -211,14 +270,23 @@ class PieceInventory:
                 pv = piece_type.value
                 monetary_value = pv * multiplier
                 piece = Piece(
-                    piece_id=f"{piece_type.name}_{piece_counter}_{id(self)}",
+                    piece_id=f"{piece_type.name}_{piece_counter}",  # unique within this inventory
                     piece_type=piece_type,
                     point_value=pv,
                     monetary_value=monetary_value,
                 )
                 self.pieces.append(piece)
+                self._by_id[piece.piece_id] = piece
                 piece_counter += 1
 
+        # Selection orders, fixed once built (stable, so equal values keep list
+        # order); the selectors return the first unassigned piece in them
+        self._by_value_desc = sorted(self.pieces, key=lambda p: -p.point_value)
+        self._tactical_by_value = sorted(
+            (p for p in self.pieces if p.piece_type in (PieceType.PAWN, PieceType.KNIGHT)),
+            key=lambda p: p.point_value,
+        )
+
     def summary(self) -> Dict[str, Dict]:
         """Return summary of inventory by type."""
         summary = {}
@@ -234,58 +302,262 @@ class PieceInventory:
 
     def get_best_piece_for_rank(self, rank: int) -> Optional[Piece]:
         """Get highest-value unassigned piece suitable for rank."""
-        unassigned = [p for p in self.pieces if not p.assigned]
-        if not unassigned:
-            return None
         # Prefer larger pieces for higher ranks
-        return sorted(unassigned, key=lambda p: -p.point_value)[0]
+        return next((p for p in self._by_value_desc if not p.assigned), None)
 
     def get_tactical_piece(self) -> Optional[Piece]:
         """Get smallest unassigned piece for tactical Black square entry."""
-        unassigned = [p for p in self.pieces if not p.assigned and p.piece_type in (PieceType.PAWN, PieceType.KNIGHT)]
-        if not unassigned:
-            return None
-        return sorted(unassigned, key=lambda p: p.point_value)[0]
+        return next((p for p in self._tactical_by_value if not p.assigned), None)
 
     def assign_piece(self, piece_id: str) -> bool:
         """Assign a piece to the board."""
-        for p in self.pieces:
-            if p.piece_id == piece_id:
-                p.assigned = True
-                return True
-        return False
+        p = self._by_id.get(piece_id)
+        if p is None:
+            return False
+        p.assigned = True
+        return True
 
     def unassign_piece(self, piece_id: str) -> bool:
         """Remove piece from board (retreat or capture)."""
-        for p in self.pieces:
-            if p.piece_id == piece_id:
-                p.assigned = False
-                p.position = None
-                p.entry_date = None
-                p.entry_price = None
-                p.entry_square = None
-                p.shares = 0
-                p.tactical_black = False
-                return True
-        return False
+        p = self._by_id.get(piece_id)
+        if p is None:
+            return False
+        p.assigned = False
+        p.position = None
+        p.entry_date = None
+        p.entry_price = None
+        p.entry_square = None
+        p.shares = 0
+        p.tactical_black = False
+        return True
 
     def get_piece(self, piece_id: str) -> Optional[Piece]:
         """Retrieve a piece by ID."""
-        for p in self.pieces:
-            if p.piece_id == piece_id:
-                return p
-        return None
+        return self._by_id.get(piece_id)
 
 
 # ============================================================================
 # SOS SCORING SYSTEM (Requirement R.1, R.4, R.5)
 # ============================================================================
 
+def _rolling_mean_2d(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean over `window` rows of a (n_days, n_tickers) array, streaming the
+    rows once with a running sum per column. NaN until a window holds `window`
+    finite values, like rolling(window, min_periods=window).mean().
+    """
+    n_days, n_tickers = values.shape
+    out = np.full((n_days, n_tickers), np.nan)
+    total = np.zeros(n_tickers)
+    count = np.zeros(n_tickers, dtype=np.int64)
+    for i in range(n_days):
+        for j in range(n_tickers):
+            x = values[i, j]
+            if not np.isnan(x):
+                total[j] += x
+                count[j] += 1
+            if i >= window:
+                old = values[i - window, j]
+                if not np.isnan(old):
+                    total[j] -= old
+                    count[j] -= 1
+            if count[j] == window:
+                out[i, j] = total[j] / window
+    return out
+
+
+def _rolling_std_2d(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing sample standard deviation (ddof=1) over `window` rows, keeping a
+    sliding Welford mean/M2 per column. NaN until a window holds `window`
+    finite values, like rolling(window, min_periods=window).std().
+    """
+    n_days, n_tickers = values.shape
+    out = np.full((n_days, n_tickers), np.nan)
+    mean = np.zeros(n_tickers)
+    m2 = np.zeros(n_tickers)
+    count = np.zeros(n_tickers, dtype=np.int64)
+    for i in range(n_days):
+        for j in range(n_tickers):
+            if i >= window:
+                old = values[i - window, j]
+                if not np.isnan(old):
+                    count[j] -= 1
+                    if count[j] == 0:
+                        mean[j] = 0.0
+                        m2[j] = 0.0
+                    else:
+                        delta = old - mean[j]
+                        mean[j] -= delta / count[j]
+                        m2[j] -= delta * (old - mean[j])
+            x = values[i, j]
+            if not np.isnan(x):
+                count[j] += 1
+                delta = x - mean[j]
+                mean[j] += delta / count[j]
+                m2[j] += delta * (x - mean[j])
+            if count[j] == window and window > 1:
+                out[i, j] = np.sqrt(max(m2[j], 0.0) / (window - 1))
+    return out
+
+
+def _sos_scores_2d(
+    mom: np.ndarray, vol: np.ndarray, w_mom: np.ndarray, w_vol: np.ndarray, lq_term: float
+) -> np.ndarray:
+    """
+    Normalized SOS for every date from (n_dates, n_tickers) MOM and VOL arrays
+    and per-date weights, one row at a time while it is in cache. Same
+    arithmetic as SOSScorer._normalize_rows: a NaN anywhere in a row makes the
+    row NaN, and a constant row scores 0.5.
+    """
+    n_dates, n_tickers = mom.shape
+    sos = np.empty((n_dates, n_tickers))
+    raw = np.empty(n_tickers)
+    for i in range(n_dates):
+        m_lo = m_hi = mom[i, 0]
+        v_lo = v_hi = vol[i, 0]
+        for j in range(n_tickers):
+            m = mom[i, j]
+            v = vol[i, j]
+            if m != m or m_lo != m_lo:
+                m_lo = m_hi = np.nan
+            elif m < m_lo:
+                m_lo = m
+            elif m > m_hi:
+                m_hi = m
+            if v != v or v_lo != v_lo:
+                v_lo = v_hi = np.nan
+            elif v < v_lo:
+                v_lo = v
+            elif v > v_hi:
+                v_hi = v
+        m_span = m_hi - m_lo
+        v_span = v_hi - v_lo
+
+        for j in range(n_tickers):
+            m_score = 0.5 if m_span == 0 else (mom[i, j] - m_lo) / m_span
+            v_score = 1.0 - (0.5 if v_span == 0 else (vol[i, j] - v_lo) / v_span)
+            raw[j] = w_mom[i] * m_score + w_vol[i] * v_score + lq_term
+
+        r_lo = r_hi = raw[0]
+        for j in range(n_tickers):
+            r = raw[j]
+            if r != r or r_lo != r_lo:
+                r_lo = r_hi = np.nan
+            elif r < r_lo:
+                r_lo = r
+            elif r > r_hi:
+                r_hi = r
+        r_span = r_hi - r_lo
+        for j in range(n_tickers):
+            sos[i, j] = 0.5 if r_span == 0 else (raw[j] - r_lo) / r_span
+    return sos
+
+
+_JIT_KERNELS: Optional[Tuple] = None
+
+
+def _jit_kernels() -> Optional[Tuple]:
+    """
+    numba-compiled (_rolling_mean_2d, _rolling_std_2d, _sos_scores_2d), or
+    None without numba.
+    """
+    global _JIT_KERNELS, HAVE_NUMBA
+    if _JIT_KERNELS is None and HAVE_NUMBA:
+        try:
+            from numba import njit
+        except ImportError:  # installed but unusable
+            HAVE_NUMBA = False
+            return None
+        _JIT_KERNELS = tuple(njit(cache=True)(f) for f in (_rolling_mean_2d, _rolling_std_2d, _sos_scores_2d))
+    return _JIT_KERNELS
+
+
 class SOSScorer:
     """Calculates Strength of Square (SOS) scores."""
 
     @staticmethod
+    def _normalize_rows(values: np.ndarray) -> np.ndarray:
+        """Min-max normalize each row (date) across tickers; constant rows become 0.5."""
+        lo = values.min(axis=1, keepdims=True)
+        hi = values.max(axis=1, keepdims=True)
+        span = hi - lo
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled = (values - lo) / span
+        return np.where(span == 0, 0.5, scaled)
+
+    @classmethod
+    def compute_panel(
+        cls,
+        price_df: pd.DataFrame,
+        ma_period: int = 50,
+        vix_data: Optional[pd.Series] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute PRICE, MA, MOM, VOL and SOS for all tickers across all dates at once.
+
+        Returns a dict of metric -> (n_dates, n_tickers) array, columns in
+        price_df order. See compute_sos_frame for the scoring rules.
+        """
+        if weights is None:
+            weights = {"M": 0.6, "Vol": 0.25, "Lq": 0.15}
+
+        # C-ordered so the row-streaming kernels read memory sequentially
+        price_arr = np.ascontiguousarray(price_df.to_numpy(dtype=np.float64))
+        returns = np.ascontiguousarray(price_df.pct_change().fillna(0).to_numpy(dtype=np.float64))
+        kernels = _jit_kernels()
+        if kernels is not None:
+            rolling_mean, rolling_std, _ = kernels
+            ma_arr = rolling_mean(price_arr, ma_period)
+            vol_arr = rolling_std(returns, ma_period)
+        elif bn is not None:
+            ma_arr = bn.move_mean(price_arr, ma_period, min_count=ma_period, axis=0)
+            vol_arr = bn.move_std(returns, ma_period, min_count=ma_period, axis=0, ddof=1)
+        else:
+            ma_arr = price_df.rolling(window=ma_period, min_periods=ma_period).mean().to_numpy(dtype=np.float64)
+            vol_arr = pd.DataFrame(returns).rolling(window=ma_period, min_periods=ma_period).std().to_numpy()
+        vol_arr = np.where(np.isnan(vol_arr), 0.0, vol_arr)
+
+        # Momentum: price relative to MA
+        mom_arr = price_arr / ma_arr - 1.0
+        mom_arr = np.where(np.isnan(mom_arr), 0.0, mom_arr)
+
+        lq_score = 0.5
+
+        # Per-date weights, adjusted where VIX is available
+        n_dates = len(price_df.index)
+        w_mom = np.full((n_dates, 1), weights["M"])
+        w_vol = np.full((n_dates, 1), weights["Vol"])
+        if vix_data is not None:
+            vix = vix_data.reindex(price_df.index).to_numpy(dtype=np.float64)
+            has_vix = price_df.index.isin(vix_data.index)
+            # Higher VIX reduces risk tolerance; ~20 is the baseline
+            risk_factor = np.minimum(1.0, vix / 20.0)
+            w_mom[has_vix, 0] = weights["M"] * (1 - 0.2 * risk_factor[has_vix])
+            w_vol[has_vix, 0] = weights["Vol"] * (1 + 0.2 * risk_factor[has_vix])
+
+        if kernels is not None:
+            sos = kernels[2](mom_arr, vol_arr, w_mom[:, 0], w_vol[:, 0], weights["Lq"] * lq_score)
+        else:
+            # Normalize across tickers for every date at once
+            mom_score = cls._normalize_rows(mom_arr)
+            # Volatility score: lower vol -> higher score
+            vol_score = 1.0 - cls._normalize_rows(vol_arr)
+            sos_raw = w_mom * mom_score + w_vol * vol_score + weights["Lq"] * lq_score
+            sos = cls._normalize_rows(sos_raw)
+
+        return {
+            "PRICE": price_arr,
+            "MA": ma_arr,
+            "MOM": mom_arr,
+            "VOL": vol_arr,
+            "SOS": sos,
+        }
+
+    @classmethod
     def compute_sos_frame(
+        cls,
         price_df: pd.DataFrame,
         ma_period: int = 50,
         vix_data: Optional[pd.Series] = None,
@@ -301,79 +573,30 @@ class SOSScorer:
         
         VIX Adjustment: Higher VIX reduces risk tolerance, adjusting weights.
         """
-        if weights is None:
-            weights = {"M": 0.6, "Vol": 0.25, "Lq": 0.15}
+        panel = cls.compute_panel(price_df, ma_period=ma_period, vix_data=vix_data, weights=weights)
+        return cls.panel_to_frame(panel, price_df)
 
+    @staticmethod
+    def panel_to_frame(panel: Dict[str, np.ndarray], price_df: pd.DataFrame) -> pd.DataFrame:
+        """Build the (ticker, metric) MultiIndex frame, columns sorted, from a compute_panel result."""
         tickers = price_df.columns.tolist()
-        ma = price_df.rolling(window=ma_period, min_periods=ma_period).mean()
-        returns = price_df.pct_change().fillna(0)
-        vol = returns.rolling(window=ma_period, min_periods=ma_period).std().fillna(0)
-
-        # Momentum: price relative to MA
-        mom = (price_df / ma - 1.0).fillna(0)
-
-        # Build output frame
-        out = pd.DataFrame(index=price_df.index)
-        for t in tickers:
-            out[(t, "PRICE")] = price_df[t]
-            out[(t, "MA")] = ma[t]
-            out[(t, "MOM")] = mom[t]
-            out[(t, "VOL")] = vol[t]
-            out[(t, "SOS")] = np.nan
-
-        out.columns = pd.MultiIndex.from_tuples(out.columns)
-
-        # Compute SOS per date
-        for date in price_df.index:
-            mom_raw = out.loc[date, pd.IndexSlice[:, "MOM"]].fillna(0)
-            vol_raw = out.loc[date, pd.IndexSlice[:, "VOL"]].fillna(0)
-
-            # Normalize momentum to [0, 1]
-            if mom_raw.max() == mom_raw.min():
-                mom_score = pd.Series(0.5, index=mom_raw.index)
-            else:
-                mom_score = (mom_raw - mom_raw.min()) / (mom_raw.max() - mom_raw.min())
-
-            # Volatility score: lower vol -> higher score
-            if vol_raw.max() == vol_raw.min():
-                vol_score = pd.Series(0.5, index=vol_raw.index)
-            else:
-                vol_score = 1.0 - (vol_raw - vol_raw.min()) / (vol_raw.max() - vol_raw.min())
-
-            lq_score = pd.Series(0.5, index=mom_raw.index)
-
-            # Adjust weights based on VIX if available
-            adj_weights = weights.copy()
-            if vix_data is not None and date in vix_data.index:
-                vix_val = vix_data.loc[date]
-                # Higher VIX reduces risk tolerance
-                risk_factor = min(1.0, vix_val / 20.0)  # Normalize ~20 as baseline
-                adj_weights["M"] = weights["M"] * (1 - 0.2 * risk_factor)
-                adj_weights["Vol"] = weights["Vol"] * (1 + 0.2 * risk_factor)
-
-            # Compute weighted SOS
-            sos_raw = (
-                adj_weights["M"] * mom_score
-                + adj_weights["Vol"] * vol_score
-                + adj_weights["Lq"] * lq_score
-            )
-
-            # Normalize to [0, 1]
-            if sos_raw.max() == sos_raw.min():
-                sos_norm = pd.Series(0.5, index=sos_raw.index)
-            else:
-                sos_norm = (sos_raw - sos_raw.min()) / (sos_raw.max() - sos_raw.min())
-
-            for ticker_idx, t in enumerate(tickers):
-                out.at[date, (t, "SOS")] = sos_norm.iloc[ticker_idx]
-
-        return out.reindex(sorted(out.columns), axis=1)
+        col_of = {t: j for j, t in enumerate(tickers)}
+        # Sorted tickers x sorted metrics is already the sorted column order
+        sorted_tickers, metrics = sorted(tickers), sorted(panel)
+        columns = pd.MultiIndex.from_product([sorted_tickers, metrics])
+        # One (n_dates, n_columns) allocation, filled column by column in place
+        data = np.empty((len(price_df.index), len(columns)))
+        k = 0
+        for t in sorted_tickers:
+            for metric in metrics:
+                data[:, k] = panel[metric][:, col_of[t]]
+                k += 1
+        return pd.DataFrame(data, index=price_df.index, columns=columns, copy=False)
 
     @staticmethod
     def sos_to_rank(sos_value: float) -> int:
         """Map SOS [0,1] to chess rank [1,8]."""
-        rank = 1 + int(np.floor((1.0 - float(sos_value)) * 8.0))
-        return max(1, min(8, rank))
+        return int(SOSScorer.sos_to_rank_array(sos_value))
 
     @staticmethod
     def sos_to_file(sos_value_secondary: float) -> str:
@@ -381,12 +604,32 @@ class SOSScorer:
         idx = int(np.floor(float(sos_value_secondary) * 8.0))
         return "ABCDEFGH"[max(0, min(7, idx))]
 
+    @staticmethod
+    def sos_to_rank_array(sos_values: np.ndarray) -> np.ndarray:
+        """
+        Map SOS values (any shape, e.g. a whole (n_dates, n_tickers) panel) to
+        ranks [1,8] as int8 in one branchless pass; NaN maps to rank 1.
+        """
+        ranks = 1 + np.floor((1.0 - np.asarray(sos_values, dtype=np.float64)) * 8.0)
+        return np.clip(np.nan_to_num(ranks, nan=1.0), 1, 8).astype(np.int8)
+
+    @staticmethod
+    def sos_to_file_index_array(sos_values: np.ndarray) -> np.ndarray:
+        """Map an array of SOS values to file indices 0-7 (A-H) as int8; NaN maps to A."""
+        idx = np.floor(np.asarray(sos_values, dtype=np.float64) * 8.0)
+        return np.clip(np.nan_to_num(idx, nan=0.0), 0, 7).astype(np.int8)
+
+    @staticmethod
+    def sos_to_file_array(sos_values: np.ndarray) -> np.ndarray:
+        """Map an array of SOS values to file letters A-H ('<U1'), element-wise."""
+        return np.array(list("ABCDEFGH"))[SOSScorer.sos_to_file_index_array(sos_values)]
+
     @staticmethod
     def sos_to_position(sos_value: float) -> BoardPosition:
         """Map SOS to a board position (rank, file)."""
         rank = SOSScorer.sos_to_rank(sos_value)
         file = SOSScorer.sos_to_file(sos_value)
-        return BoardPosition(rank, file)
+        return board_position(rank, file)
 
 
 # ============================================================================
@@ -396,9 +639,17 @@ class SOSScorer:
 class ChessBoard:
     """Represents the 8x8 trading board with stock positions."""
 
-    def __init__(self):
+    def __init__(self, capacity: int = 8):
         self.tiles: Dict[str, StockTile] = {}  # ticker -> StockTile
         self.pieces_on_board: Dict[str, Piece] = {}  # ticker -> Piece
+        # Structure-of-arrays mirror of tiles for whole-board scans: one slot
+        # per ticker, in tiles order, kept in step by update_stock
+        self._slot: Dict[str, int] = {}
+        self._rank = np.zeros(capacity, dtype=np.int8)
+        self._file = np.zeros(capacity, dtype=np.int8)  # 0-7 for A-H
+        self._white = np.zeros(capacity, dtype=bool)
+        self._sos = np.zeros(capacity)
+        self._price = np.zeros(capacity)
 
     def update_stock(
         self,
@@ -409,11 +660,20 @@ class ChessBoard:
         vix: float,
         momentum: float,
         volatility: float,
+        square_color: Optional[SquareColor] = None,
+        rank: Optional[int] = None,
+        file: Optional[str] = None,
     ):
-        """Update stock position on board."""
-        square_color = SquareColor.WHITE if price > ma else SquareColor.BLACK
-        rank = SOSScorer.sos_to_rank(sos_score)
-        file = SOSScorer.sos_to_file(sos_score)
+        """
+        Update stock position on board. Square color, rank and file are derived
+        from price/MA and SOS unless passed in precomputed.
+        """
+        if square_color is None:
+            square_color = SquareColor.WHITE if price > ma else SquareColor.BLACK
+        if rank is None:
+            rank = SOSScorer.sos_to_rank(sos_score)
+        if file is None:
+            file = SOSScorer.sos_to_file(sos_score)
 
         self.tiles[ticker] = StockTile(
             ticker=ticker,
@@ -428,25 +688,55 @@ class ChessBoard:
             volatility=volatility,
         )
 
+        slot = self._slot.get(ticker)
+        if slot is None:
+            slot = self._slot[ticker] = len(self._slot)
+            if slot == len(self._rank):
+                for name in ("_rank", "_file", "_white", "_sos", "_price"):
+                    old = getattr(self, name)
+                    grown = np.zeros(2 * len(old), dtype=old.dtype)
+                    grown[: len(old)] = old
+                    setattr(self, name, grown)
+        self._rank[slot] = rank
+        self._file[slot] = ord(file) - ord("A")
+        self._white[slot] = square_color == SquareColor.WHITE
+        self._sos[slot] = sos_score
+        self._price[slot] = price
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Tile attributes as arrays in tiles order: rank (int8), file (int8,
+        0-7 for A-H), white (bool), sos and price (float64). Views, not copies.
+        """
+        n = len(self._slot)
+        return {
+            "rank": self._rank[:n],
+            "file": self._file[:n],
+            "white": self._white[:n],
+            "sos": self._sos[:n],
+            "price": self._price[:n],
+        }
+
+    def slot_of(self, ticker: str) -> Optional[int]:
+        """Position of ticker in tiles order (its index into arrays()), or None."""
+        return self._slot.get(ticker)
+
     def get_tile(self, ticker: str) -> Optional[StockTile]:
         """Get a stock tile by ticker."""
         return self.tiles.get(ticker)
 
     def display_board(self):
         """Display current board state (ASCII art)."""
-        board = [["." for _ in range(8)] for _ in range(8)]
+        tiles = self.arrays()
+        board = np.full(64, ".", dtype="<U1")
+        cells = (8 - tiles["rank"].astype(np.intp)) * 8 + tiles["file"]  # Invert ranks for display
+        # Where tickers share a square the last one in tiles order is shown
+        cells, last = np.unique(cells[::-1], return_index=True)
+        board[cells] = np.where(tiles["white"][::-1][last], "W", "B")
+        board = board.reshape(8, 8).tolist()
 
-        for tile in self.tiles.values():
-            rank_idx = 8 - tile.rank  # Invert for display
-            file_idx = ord(tile.file) - ord('A')
-            marker = "W" if tile.square_color == SquareColor.WHITE else "B"
-            board[rank_idx][file_idx] = marker
-
-        print("\n  A B C D E F G H")
-        for i, row in enumerate(board):
-            rank = 8 - i
-            print(f"{rank} {' '.join(row)}")
-        print()
+        rows = "\n".join(f"{8 - i} {' '.join(row)}" for i, row in enumerate(board))
+        print(f"\n  A B C D E F G H\n{rows}\n")
 
 
 # ============================================================================
@@ -470,18 +760,9 @@ class TradingRulesEngine:
             return False, "Position is not on White Square"
 
         # Suggest appropriate piece for rank
-        if tile.rank <= 2:
-            if piece.point_value < 1:
-                return False, f"Rank {tile.rank} requires at least Pawn (PV>=1)"
-        elif tile.rank <= 4:
-            if piece.point_value < 3:
-                return False, f"Rank {tile.rank} requires at least Knight/Bishop (PV>=3)"
-        elif tile.rank <= 6:
-            if piece.point_value < 5:
-                return False, f"Rank {tile.rank} requires at least Rook (PV>=5)"
-        else:
-            if piece.point_value < 9:
-                return False, f"Rank {tile.rank} requires Queen (PV>=9)"
+        min_pv = int(_MIN_PV_BY_RANK[tile.rank])
+        if piece.point_value < min_pv:
+            return False, f"Rank {tile.rank} {_MIN_PV_MESSAGES[min_pv]}"
 
         return True, "Valid deployment on White Square"
 
@@ -538,6 +819,47 @@ class TradingRulesEngine:
             return None
         return f"ENDGAME: {tile.ticker} at Rank {tile.rank}. Consider taking profit (+{gain_pct:.1f}%)"
 
+    @staticmethod
+    def required_white_point_value(ranks: np.ndarray) -> np.ndarray:
+        """Minimum piece value for a White square deployment at each rank (R.6, R.13)."""
+        return _MIN_PV_BY_RANK[np.asarray(ranks)]
+
+    def evaluate_batch(
+        self,
+        ranks: np.ndarray,
+        white: np.ndarray,
+        point_values: np.ndarray,
+        gains: Optional[np.ndarray] = None,
+        entry_white: Optional[np.ndarray] = None,
+        tactical_black: Optional[np.ndarray] = None,
+        reclaim_windows: Optional[np.ndarray] = None,
+        days_held: int = 0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Rules R.6, R.7, R.14, R.15 for many (tile, piece) pairs at once. Each
+        mask is True where the scalar check would fire:
+        - "deploy_white": can_deploy_on_white
+        - "retreat": check_retreat_required (needs entry_white; tactical_black
+          and reclaim_windows default to no tactical entry)
+        - "scale": check_scaling_opportunity
+        - "profit": check_profit_taking (needs gains)
+        """
+        ranks = np.asarray(ranks)
+        white = np.asarray(white, dtype=bool)
+        point_values = np.asarray(point_values)
+        masks = {
+            "deploy_white": white & (point_values >= self.required_white_point_value(ranks)),
+            "scale": white & (ranks >= 5) & (point_values < 5),
+        }
+        if entry_white is not None:
+            retreat = np.asarray(entry_white, dtype=bool) & ~white
+            if tactical_black is not None and reclaim_windows is not None:
+                retreat |= np.asarray(tactical_black, dtype=bool) & (days_held > np.asarray(reclaim_windows))
+            masks["retreat"] = retreat
+        if gains is not None:
+            masks["profit"] = (ranks >= 7) & (np.asarray(gains) > 0)
+        return masks
+
     def check_game_phase(self, game_state: GameState) -> GamePhase:
         """
         Determine game phase:
@@ -568,35 +890,125 @@ class MoveSuggestionEngine:
         self,
         game_state: GameState,
         piece_inventory: PieceInventory,
+        k: int = 3,
     ) -> List[Dict]:
         """
-        Suggest top 3 optimal moves (Deployment, Advancement, Retreat/Capture).
+        Suggest top k (default 3) optimal moves (Deployment, Advancement,
+        Retreat/Capture). Tiles are scanned through the board's arrays: rules
+        for open positions and deployment priorities for all other tiles are
+        evaluated in batches, and only triggered positions and the top-k
+        deployments become suggestion dicts. Ties keep board order.
         """
-        suggestions = []
-
-        # Scan all tiles for opportunities
+        board = self.board.arrays()
+        tiles = list(self.board.tiles.values())  # same order as the arrays
+        is_open = np.zeros(len(tiles), dtype=bool)
+        for ticker in game_state.positions_open:
+            slot = self.board.slot_of(ticker)
+            if slot is not None:
+                is_open[slot] = True
+
+        # (priority, tile order, advice order, advice)
         opportunities = []
-        for ticker, tile in self.board.tiles.items():
-            if ticker in game_state.positions_open:
-                # Existing position: check retreat/advance
-                piece = game_state.positions_open[ticker]
-                advice = self._analyze_existing_position(piece, tile, game_state)
-                if advice:
-                    opportunities.extend(advice)
-            else:
-                # New opportunity: check deployment
-                advice = self._analyze_deployment_opportunity(tile, piece_inventory, game_state)
-                if advice:
-                    opportunities.extend(advice)
-
-        # Sort by score and return top 3
-        opportunities.sort(key=lambda x: -x["priority_score"])
-        return opportunities[:3]
-
-    def _analyze_existing_position(self, piece: Piece, tile: StockTile, game_state: GameState) -> List[Dict]:
+
+        # Existing positions: P&L and rule masks for all in one pass; only
+        # positions with a triggered rule are analysed into advice
+        open_slots = np.flatnonzero(is_open)
+        if len(open_slots):
+            pieces = [game_state.positions_open[tiles[slot].ticker] for slot in open_slots.tolist()]
+            gains = Piece.gain_loss_pct_many(pieces, board["price"][open_slots])
+            masks = self.rules_engine.evaluate_batch(
+                ranks=board["rank"][open_slots],
+                white=board["white"][open_slots],
+                point_values=np.array([piece.point_value for piece in pieces]),
+                gains=gains,
+                entry_white=np.array([piece.entry_square == SquareColor.WHITE for piece in pieces]),
+                tactical_black=np.array([piece.tactical_black for piece in pieces]),
+                reclaim_windows=np.array([piece.tactical_reclaim_window for piece in pieces]),
+            )
+            triggered = masks["retreat"] | masks["profit"] | masks["scale"]
+            gains = gains.tolist()
+            for i in np.flatnonzero(triggered).tolist():
+                order = int(open_slots[i])
+                advice = self._analyze_existing_position(pieces[i], tiles[order], game_state, gains[i])
+                opportunities.extend((a["priority_score"], order, sub, a) for sub, a in enumerate(advice))
+
+        # New opportunities: one candidate deployment per tile at most
+        free_slots = np.flatnonzero(~is_open)
+        if len(free_slots):
+            white = board["white"][free_slots]
+            black_tile = None if white.all() else tiles[int(free_slots[np.argmin(white)])]
+            priority = self._deployment_priorities(
+                board["rank"][free_slots], white, board["sos"][free_slots],
+                piece_inventory, game_state, black_tile,
+            )
+            for idx in self._top_k(priority, k).tolist():
+                order = int(free_slots[idx])
+                advice = self._analyze_deployment_opportunity(tiles[order], piece_inventory, game_state)
+                opportunities.extend((a["priority_score"], order, sub, a) for sub, a in enumerate(advice))
+
+        opportunities.sort(key=lambda x: (-x[0], x[1], x[2]))
+        return [advice for *_, advice in opportunities[:k]]
+
+    def _deployment_priorities(
+        self,
+        rank: np.ndarray,
+        white: np.ndarray,
+        sos: np.ndarray,
+        inventory: PieceInventory,
+        game_state: GameState,
+        black_tile: Optional[StockTile] = None,
+    ) -> np.ndarray:
+        """
+        priority_score that _analyze_deployment_opportunity would give each
+        tile (given as rank/white/sos arrays), NaN where it would suggest
+        nothing. Pieces are picked once per rank and the rules are evaluated
+        for all tiles in one batch; black_tile is any of the Black tiles.
+        """
+        rank = rank.astype(np.int64)
+
+        # Piece offered for each rank (index 0 unused); 0 PV where none is left
+        # or deploying it would exceed what King's cash can fund
+        piece_pv = np.zeros(9, dtype=np.int64)
+        for r in np.unique(rank[white]).tolist():
+            piece = inventory.get_best_piece_for_rank(r)
+            if piece and game_state.pieces_deployed < game_state.king_cash / piece.monetary_value:
+                piece_pv[r] = piece.point_value
+        pv = piece_pv[rank]
+        white_ok = self.rules_engine.evaluate_batch(rank, white, pv)["deploy_white"] & (pv > 0)
+
+        black_ok = False
+        if black_tile is not None:
+            tactical_piece = inventory.get_tactical_piece()
+            if tactical_piece:
+                black_ok, _ = self.rules_engine.can_deploy_tactical_black(black_tile, tactical_piece)
+
+        return np.where(
+            white,
+            np.where(white_ok, sos * 100, np.nan),
+            sos * 50 if black_ok else np.nan,
+        )
+
+    @staticmethod
+    def _top_k(priority: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k highest non-NaN priorities, lowest index first on ties (O(n))."""
+        candidates = np.flatnonzero(~np.isnan(priority))
+        if k <= 0:
+            return candidates[:0]
+        if len(candidates) <= k:
+            return candidates
+        values = priority[candidates]
+        kth = -np.partition(-values, k - 1)[k - 1]
+        above = candidates[values > kth]
+        ties = candidates[values == kth][: k - len(above)]
+        return np.concatenate([above, ties])
+
+    def _analyze_existing_position(
+        self, piece: Piece, tile: StockTile, game_state: GameState, gain_pct: Optional[float] = None
+    ) -> List[Dict]:
         """Analyze existing position for retreat/advance/profit-taking."""
         advice = []
-        gain_pct = piece.gain_loss_pct(tile.current_price) if piece.entry_price else 0.0
+        if gain_pct is None:
+            gain_pct = piece.gain_loss_pct(tile.current_price) if piece.entry_price else 0.0
 
         # Check retreat
         retreat_required, reason = self.rules_engine.check_retreat_required(piece, tile)
@@ -672,9 +1084,52 @@ class MoveSuggestionEngine:
 # MAIN CHESS FRAMEWORK CLASS
 # ============================================================================
 
+def _cache_key(*parts) -> str:
+    return hashlib.sha1(json.dumps(parts, default=str).encode()).hexdigest()[:16]
+
+
+def _cache_is_fresh(path: str, end_date: Optional[str]) -> bool:
+    if not os.path.exists(path):
+        return False
+    mtime = os.path.getmtime(path)
+    if time.time() - mtime < CACHE_TTL_SECONDS:
+        return True
+    return end_date is not None and pd.Timestamp(end_date) <= pd.Timestamp(mtime, unit="s").normalize()
+
+
+def fetch_prices(tickers: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+    """Adjusted close prices from yfinance, columns = tickers (end date exclusive)."""
+    import yfinance as yf  # deferred: slow to import and only needed to download
+    # One batched request, tickers fetched concurrently
+    df = yf.download(
+        tickers, start=start_date, end=end_date, progress=False,
+        auto_adjust=False, threads=True, group_by="ticker",
+    )
+    if not isinstance(df.columns, pd.MultiIndex):  # older yfinance, single ticker
+        df = pd.concat({tickers[0]: df}, axis=1)
+
+    # group_by="ticker" puts the field on level 1; fall back to level 0 in
+    # case a yfinance version ignores it
+    level = 1 if "Close" in df.columns.get_level_values(1) else 0
+    fields = df.columns.get_level_values(level)
+    field = "Adj Close" if "Adj Close" in fields else "Close"
+    return df.xs(field, level=level, axis=1).reindex(columns=tickers)
+
+
+def _atomic_write(path: str, write) -> None:
+    """Call write(tmp_path), then move the file into place."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
 class ChessFrameworkTrader:
     """Main orchestrator for the chess trading framework."""
 
+    # Downloaded price frames and SOS panels for this process, by cache key
+    _MEM_CACHE: Dict[str, object] = {}
+
     def __init__(
         self,
         tickers: List[str],
@@ -682,6 +1137,7 @@ class ChessFrameworkTrader:
         risk_level: RiskLevel,
         ma_period: int = 50,
         max_positions: int = 8,
+        verbose: bool = True,
     ):
         if not (3 <= len(tickers) <= 10):
             raise ValueError("Must provide 3-10 tickers")
@@ -691,6 +1147,7 @@ class ChessFrameworkTrader:
         self.risk_level = risk_level
         self.ma_period = ma_period
         self.max_positions = max_positions
+        self.verbose = verbose  # progress output and print_summary; off inside backtests
 
         # Initialize components
         self.momentum_capital = total_capital * risk_level.allocation
@@ -713,58 +1170,176 @@ class ChessFrameworkTrader:
 
         self.price_data: Optional[pd.DataFrame] = None
         self.sos_data: Optional[pd.DataFrame] = None
+        self.date_labels: Optional[List[str]] = None  # price_data dates as YYYY-MM-DD
+        self._sos_array: Optional[np.ndarray] = None  # (n_dates, n_tickers), ticker order
+        self._board_cache: Optional[Dict[str, np.ndarray]] = None
+        self._white_mask: Optional[np.ndarray] = None  # price > MA, (n_dates, n_tickers)
+        self._ticker_idx = {ticker: i for i, ticker in enumerate(self.tickers)}
 
-    def load_market_data(self, start_date: str, end_date: str):
-        """Download market data for backtesting."""
-        print(f"Loading market data for {self.tickers} from {start_date} to {end_date}...")
-
-        df = yf.download(self.tickers, start=start_date, end=end_date, progress=False, auto_adjust=False)
+    def load_market_data(
+        self,
+        start_date: str,
+        end_date: str,
+        use_cache: bool = True,
+        prices: Optional[pd.DataFrame] = None,
+    ):
+        """
+        Download market data for backtesting. With use_cache, prices come from
+        memory or the parquet cache under CACHE_DIR when fresh, and the derived
+        SOS panels from memory or a sibling .npy, instead of the network and a
+        recompute. A `prices` frame (e.g. from fetch_prices, covering these
+        tickers and dates) is used in place of a download.
+        """
+        if self.verbose:
+            print(f"Loading market data for {self.tickers} from {start_date} to {end_date}...")
 
-        if "Adj Close" in df.columns:
-            price = df["Adj Close"].copy()
+        if prices is not None:
+            dates = prices.index
+            price = prices[(dates >= start_date) & (dates < end_date)]
         else:
-            price = df["Close"].copy()
+            price = self._load_prices(start_date, end_date, use_cache)
 
         self.price_data = price.reindex(columns=self.tickers)
         self.price_data = self.price_data.ffill().dropna()
+        self.date_labels = self.price_data.index.strftime("%Y-%m-%d").tolist()
+
+        if self.verbose:
+            print(f"Loaded {len(self.price_data)} trading days")
+
+        # Compute SOS data; the SOS panel is also kept as an array for per-date reads
+        panel = self._load_panel(start_date, end_date, use_cache)
+        self._sos_array = panel["SOS"]
+        self.sos_data = self.sos_scorer.panel_to_frame(panel, self.price_data)
+        # Square colors for every date at once (NaN MA compares False -> BLACK)
+        self._white_mask = panel["PRICE"] > panel["MA"]
+        self._board_cache = self._build_board_cache(panel)
+
+    def _load_prices(self, start_date: str, end_date: str, use_cache: bool) -> pd.DataFrame:
+        """Adjusted close prices, columns = tickers, from cache or yfinance."""
+        key = _cache_key(sorted(self.tickers), start_date, end_date)
+        path = os.path.join(CACHE_DIR, f"{key}.parquet")
+        if use_cache:
+            if key in self._MEM_CACHE:
+                return self._MEM_CACHE[key]
+            if _cache_is_fresh(path, end_date):
+                try:
+                    price = pd.read_parquet(path)
+                    self._MEM_CACHE[key] = price
+                    return price
+                except ImportError:  # no parquet engine
+                    pass
+
+        price = fetch_prices(self.tickers, start_date, end_date)
+
+        if use_cache:
+            self._MEM_CACHE[key] = price
+            try:
+                _atomic_write(path, lambda tmp: price.to_parquet(tmp))
+            except ImportError:  # no parquet engine; memory cache only
+                pass
+        return price
+
+    def _load_panel(self, start_date: str, end_date: str, use_cache: bool) -> Dict[str, np.ndarray]:
+        """
+        SOS panels for price_data, reusing the .npy cache when it matches these
+        prices. The cache is memory-mapped read-only, so panels are paged in on
+        demand and shared through the OS page cache by concurrent processes.
+        """
+        key = _cache_key(self.tickers, start_date, end_date, self.ma_period)
+        path = os.path.join(CACHE_DIR, f"{key}.npy")
+        price_arr = self.price_data.to_numpy(dtype=np.float64)
+
+        def matches(panel):
+            # Only valid for exactly these prices (a refreshed download invalidates it)
+            return panel["PRICE"].shape == price_arr.shape and np.array_equal(panel["PRICE"], price_arr)
+
+        if use_cache:
+            panel = self._MEM_CACHE.get(key)
+            if panel is not None and matches(panel):
+                return panel
+            if _cache_is_fresh(path, end_date):
+                stacked = np.load(path, mmap_mode="r")
+                panel = dict(zip(PANEL_METRICS, stacked))
+                if matches(panel):
+                    self._MEM_CACHE[key] = panel
+                    return panel
+
+        panel = self.sos_scorer.compute_panel(self.price_data, ma_period=self.ma_period)
+        if use_cache:
+            self._MEM_CACHE[key] = panel
+            def write_npy(tmp_path):
+                # Through a file object: given a path, save would append ".npy"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, np.stack([panel[name] for name in PANEL_METRICS]))
+            _atomic_write(path, write_npy)
+        return panel
+
+    def _build_board_cache(self, panel: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Per-date board layout as (n_dates, n_tickers) arrays, computed once so
+        get_current_board_state only reads a row. Ranks and files (0-7 for
+        A-H) are int8, one byte per square like the bool masks.
+        """
+        sos = panel["SOS"]
+        return {
+            "price": panel["PRICE"],
+            "ma": panel["MA"],
+            "sos": sos,
+            "mom": panel["MOM"],
+            "vol": panel["VOL"],
+            "valid": ~np.isnan(sos),
+            "rank": SOSScorer.sos_to_rank_array(sos),
+            "file": SOSScorer.sos_to_file_index_array(sos),
+            "white": self._white_mask,
+        }
+
+    def get_metric(self, date_idx: int, ticker: str, metric: str = "SOS") -> float:
+        """
+        One PRICE/MA/MOM/VOL/SOS value by integer date index and ticker, read
+        from the precomputed panels instead of a sos_data.loc MultiIndex lookup.
+        """
+        if self._board_cache is None:
+            raise ValueError("No market data loaded")
+        return float(self._board_cache[metric.lower()][date_idx, self._ticker_idx[ticker]])
 
-        print(f"Loaded {len(self.price_data)} trading days")
-
-        # Compute SOS data
-        self.sos_data = self.sos_scorer.compute_sos_frame(self.price_data, ma_period=self.ma_period)
+    def get_metric_row(self, date_idx: int, metric: str = "SOS") -> np.ndarray:
+        """One PRICE/MA/MOM/VOL/SOS value per ticker (in self.tickers order) by integer date index."""
+        if self._board_cache is None:
+            raise ValueError("No market data loaded")
+        return self._board_cache[metric.lower()][date_idx]
 
     def get_current_board_state(self, date_idx: int) -> Dict:
         """Get board state at a specific date."""
         if self.price_data is None or self.sos_data is None:
             return {}
 
-        date = self.price_data.index[date_idx]
-        state = {"date": date.strftime("%Y-%m-%d"), "tiles": {}}
+        state = {"date": self.date_labels[date_idx], "tiles": {}}
 
-        for ticker in self.tickers:
-            if date not in self.price_data.index:
-                continue
-
-            price = self.price_data.loc[date, ticker]
-            ma = self.sos_data.loc[date, (ticker, "MA")]
-            sos = self.sos_data.loc[date, (ticker, "SOS")]
-            momentum = self.sos_data.loc[date, (ticker, "MOM")]
-            volatility = self.sos_data.loc[date, (ticker, "VOL")]
-            vix = 20.0  # Placeholder (would need VIX data)
+        # One row of each precomputed panel, as plain Python values
+        row = {name: values[date_idx].tolist() for name, values in self._board_cache.items()}
+        vix = 20.0  # Placeholder (would need VIX data)
 
+        for ticker_idx, ticker in enumerate(self.tickers):
             # Skip if SOS is NaN (insufficient data)
-            if pd.isna(sos):
+            if not row["valid"][ticker_idx]:
                 continue
 
-            self.board.update_stock(ticker, price, ma, sos, vix, momentum, volatility)
+            price = row["price"][ticker_idx]
+            ma = row["ma"][ticker_idx]
+            sos = row["sos"][ticker_idx]
+            square_color = SquareColor.WHITE if row["white"][ticker_idx] else SquareColor.BLACK
+            self.board.update_stock(
+                ticker, price, ma, sos, vix, row["mom"][ticker_idx], row["vol"][ticker_idx],
+                square_color=square_color, rank=row["rank"][ticker_idx], file="ABCDEFGH"[row["file"][ticker_idx]],
+            )
             tile = self.board.get_tile(ticker)
 
             state["tiles"][ticker] = {
-                "price": float(price),
-                "ma": float(ma),
-                "sos": float(sos),
-                "position": str(tile.position),
-                "square": tile.square_color.value,
+                "price": price,
+                "ma": ma,
+                "sos": sos,
+                "position": f"{tile.file}{tile.rank}",
+                "square": square_color.value,
             }
 
         return state
@@ -774,7 +1349,9 @@ class ChessFrameworkTrader:
         return self.suggestion_engine.suggest_moves(self.game_state, self.inventory)
 
     def print_summary(self):
-        """Print game summary."""
+        """Print game summary (skipped when not verbose)."""
+        if not self.verbose:
+            return
         print("\n" + "="*80)
         print("CHESS FRAMEWORK TRADING SYSTEM")
         print("="*80)
@@ -5,8 +5,9 @@ Inspired by Chess.com's modern, professional design
 Uses Flask + HTML5 + CSS3 + JavaScript for interactive trading
 """
 
-from flask import Flask, render_template, jsonify, request
-from flask import redirect
+from flask import Flask, jsonify, request
+from flask import redirect, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from chess_framework import (
     ChessFrameworkTrader,
     RiskLevel,
@@ -19,26 +20,145 @@ try:
 except Exception:
     pychess = None
     get_best_moves = None
-import pandas as pd
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import numpy as np
 import json
 from datetime import datetime
+from enum import Enum
+import functools
 import os
+import threading
 import random
 import math
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, for responses and request bodies.
+    Output matches the default provider (dates, Decimals, dataclasses still go
+    through Flask's conversions), and NumPy values and Enums are serialized
+    directly instead of failing.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _default(self, o):
+        if isinstance(o, Enum):
+            return o.value
+        return self.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self._default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self._default, option=self._options(indent) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
 app.config['JSON_SORT_KEYS'] = False
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Global trader instance
 trader = None
 current_date_idx = None
 historical_trades = []
 
+# Upper-case python-chess square names, indexed by square
+SQUARE_NAMES = tuple(name.upper() for name in pychess.SQUARE_NAMES) if pychess is not None else ()
+# UCI promotion suffix indexed by piece type (0 for no promotion)
+PROMOTION_SUFFIX = ('',) + tuple(pychess.piece_symbol(pt) for pt in pychess.PIECE_TYPES) if pychess is not None else ()
+
+# Board squares in display order (rank 8 down to 1, files A-H) with their
+# (file, rank, square colour)
+POSITIONS = tuple(f + str(r) for r in range(8, 0, -1) for f in 'ABCDEFGH')
+POSITION_META = tuple(
+    (pos[0], int(pos[1]),
+     SquareColor.WHITE.value if (ord(pos[0]) + int(pos[1])) % 2 == 0 else SquareColor.BLACK.value)
+    for pos in POSITIONS
+)
+
+# Initial chess piece layout overlay - all 32 pieces in starting positions
+PIECES_LAYOUT = (
+    # White pieces (rank 1)
+    {'position': 'A1', 'piece': 'ROOK', 'color': 'WHITE'},
+    {'position': 'B1', 'piece': 'KNIGHT', 'color': 'WHITE'},
+    {'position': 'C1', 'piece': 'BISHOP', 'color': 'WHITE'},
+    {'position': 'D1', 'piece': 'QUEEN', 'color': 'WHITE'},
+    {'position': 'E1', 'piece': 'KING', 'color': 'WHITE'},
+    {'position': 'F1', 'piece': 'BISHOP', 'color': 'WHITE'},
+    {'position': 'G1', 'piece': 'KNIGHT', 'color': 'WHITE'},
+    {'position': 'H1', 'piece': 'ROOK', 'color': 'WHITE'},
+    # White pawns (rank 2)
+    {'position': 'A2', 'piece': 'PAWN', 'color': 'WHITE'},
+    {'position': 'B2', 'piece': 'PAWN', 'color': 'WHITE'},
+    {'position': 'C2', 'piece': 'PAWN', 'color': 'WHITE'},
+    {'position': 'D2', 'piece': 'PAWN', 'color': 'WHITE'},
+    {'position': 'E2', 'piece': 'PAWN', 'color': 'WHITE'},
+    {'position': 'F2', 'piece': 'PAWN', 'color': 'WHITE'},
+    {'position': 'G2', 'piece': 'PAWN', 'color': 'WHITE'},
+    {'position': 'H2', 'piece': 'PAWN', 'color': 'WHITE'},
+    # Black pawns (rank 7)
+    {'position': 'A7', 'piece': 'PAWN', 'color': 'BLACK'},
+    {'position': 'B7', 'piece': 'PAWN', 'color': 'BLACK'},
+    {'position': 'C7', 'piece': 'PAWN', 'color': 'BLACK'},
+    {'position': 'D7', 'piece': 'PAWN', 'color': 'BLACK'},
+    {'position': 'E7', 'piece': 'PAWN', 'color': 'BLACK'},
+    {'position': 'F7', 'piece': 'PAWN', 'color': 'BLACK'},
+    {'position': 'G7', 'piece': 'PAWN', 'color': 'BLACK'},
+    {'position': 'H7', 'piece': 'PAWN', 'color': 'BLACK'},
+    # Black pieces (rank 8)
+    {'position': 'A8', 'piece': 'ROOK', 'color': 'BLACK'},
+    {'position': 'B8', 'piece': 'KNIGHT', 'color': 'BLACK'},
+    {'position': 'C8', 'piece': 'BISHOP', 'color': 'BLACK'},
+    {'position': 'D8', 'piece': 'QUEEN', 'color': 'BLACK'},
+    {'position': 'E8', 'piece': 'KING', 'color': 'BLACK'},
+    {'position': 'F8', 'piece': 'BISHOP', 'color': 'BLACK'},
+    {'position': 'G8', 'piece': 'KNIGHT', 'color': 'BLACK'},
+    {'position': 'H8', 'piece': 'ROOK', 'color': 'BLACK'},
+)
+
+# Last board-state tiles (see build_board_tiles)
+board_tiles_cache = {'key': None, 'tiles': None}
+
 # Simple python-chess game state (for chess-only mode)
 chess_game = {
     'board': None,  # pychess.Board instance
 }
 
+# Legal moves (UCI) for the last position served by /api/chess/legal_moves
+legal_moves_cache = {'fen': None, 'moves': None}
+
+
+# The globals above (and chess_ai's search tables) are shared by every request
+# thread; API handlers that touch them run one at a time under this lock
+state_lock = threading.RLock()
+
+
+def serialized(handler):
+    """Run a request handler while holding state_lock."""
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        with state_lock:
+            return handler(*args, **kwargs)
+    return wrapper
+
 
 @app.route('/')
 def index():
@@ -50,10 +170,12 @@ def index():
 @app.route('/chess')
 def chess_only():
     """Serve a minimal pure-chess page (no stocks)."""
-    return render_template('chess_only.html')
+    # The page has no template variables, so it is sent as a static file
+    return send_from_directory(app.template_folder, 'chess_only.html', max_age=3600)
 
 
 @app.route('/api/chess/init', methods=['POST'])
+@serialized
 def chess_init():
     """Initialize a fresh chess board (server-side with python-chess)."""
     global chess_game
@@ -67,6 +189,7 @@ def chess_init():
 
 
 @app.route('/api/chess/state', methods=['GET'])
+@serialized
 def chess_state():
     """Return board state (FEN + pieces)"""
     global chess_game
@@ -75,18 +198,22 @@ def chess_state():
     board = chess_game.get('board')
     if board is None:
         return jsonify({'status': 'error', 'message': 'Board not initialized'}), 400
-    # Build pieces list
+    # Build pieces list from the occupied squares only (a1..h8 order)
     pieces = []
-    for square in pychess.SQUARES:
-        piece = board.piece_at(square)
-        if piece:
-            square_name = pychess.square_name(square).upper()
-            pieces.append({'position': square_name, 'piece': piece.piece_type, 'color': 'WHITE' if piece.color else 'BLACK', 'symbol': piece.symbol()})
+    white = board.occupied_co[pychess.WHITE]
+    for square in pychess.scan_forward(board.occupied):
+        piece_type = board.piece_type_at(square)
+        symbol = pychess.piece_symbol(piece_type)
+        if white & pychess.BB_SQUARES[square]:
+            pieces.append({'position': SQUARE_NAMES[square], 'piece': piece_type, 'color': 'WHITE', 'symbol': symbol.upper()})
+        else:
+            pieces.append({'position': SQUARE_NAMES[square], 'piece': piece_type, 'color': 'BLACK', 'symbol': symbol})
 
     return jsonify({'status': 'success', 'fen': board.fen(), 'turn': 'white' if board.turn else 'black', 'pieces': pieces})
 
 
 @app.route('/api/chess/move', methods=['POST'])
+@serialized
 def chess_move():
     """Attempt a move; body should contain 'from' and 'to' (e.g., 'e2' -> 'e4') or UCI like 'e2e4'."""
     global chess_game
@@ -107,25 +234,22 @@ def chess_move():
             return jsonify({'status': 'error', 'message': 'Missing move'}), 400
         move_raw = frm + to
 
+    # try UCI, then SAN
     try:
-        # try UCI
         move = pychess.Move.from_uci(move_raw)
-        if move not in board.legal_moves:
-            # try SAN
+    except Exception:
+        move = None
+    try:
+        if move is None or not board.is_legal(move):
             move = board.parse_san(move_raw)
         board.push(move)
         return jsonify({'status': 'success', 'fen': board.fen(), 'move': move.uci()})
-    except Exception:
-        # try SAN parse
-        try:
-            move = board.parse_san(move_raw)
-            board.push(move)
-            return jsonify({'status': 'success', 'fen': board.fen(), 'move': move.uci()})
-        except Exception as e:
-            return jsonify({'status': 'error', 'message': 'Illegal move or parse failure: ' + str(e)}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': 'Illegal move or parse failure: ' + str(e)}), 400
 
 
 @app.route('/api/initialize', methods=['POST'])
+@serialized
 def initialize():
     """Initialize trader with user parameters."""
     global trader, current_date_idx, historical_trades
@@ -155,6 +279,7 @@ def initialize():
         trader.load_market_data("2023-01-01", "2023-12-31")
         current_date_idx = trader.ma_period
         historical_trades = []
+        board_tiles_cache['key'] = None
         
         return jsonify({
             'status': 'success',
@@ -167,8 +292,8 @@ def initialize():
                 'ma_period': ma_period,
                 'tickers': tickers,
                 'dates_available': len(trader.price_data),
-                'start_date': trader.price_data.index[0].strftime('%Y-%m-%d'),
-                'end_date': trader.price_data.index[-1].strftime('%Y-%m-%d'),
+                'start_date': trader.date_labels[0],
+                'end_date': trader.date_labels[-1],
             },
             'inventory': trader.inventory.summary()
         })
@@ -176,7 +301,110 @@ def initialize():
         return jsonify({'status': 'error', 'message': str(e)}), 400
 
 
+def build_board_tiles(trader, date_idx):
+    """
+    Outcome tiles for all 64 squares on date_idx. They depend only on the
+    trader's market data, tickers and the date, so the last result is kept in
+    board_tiles_cache and reused while the GUI polls the same day.
+    """
+    key = (id(trader), date_idx, tuple(trader.tickers))
+    if trader.tickers and board_tiles_cache['key'] == key:
+        return board_tiles_cache['tiles']
+
+    tickers = trader.tickers if trader is not None and len(trader.tickers) > 0 else ['AAPL','MSFT','GOOGL','AMZN','TSLA']
+
+    # Base price/MA/SOS for every ticker, then the outcome math for all of
+    # them at once (placeholder values when no market data is available)
+    try:
+        if not trader.tickers:
+            raise ValueError("No tickers")
+        base_price, base_ma, base_sos = (
+            trader.get_metric_row(date_idx, metric) for metric in ('PRICE', 'MA', 'SOS')
+        )
+    except Exception:
+        base_price = np.array([100.0 + random.randint(-5, 5) for _ in tickers])
+        base_ma = base_price * 0.98
+        base_sos = np.full(len(tickers), 0.5)
+    base_sos = np.where(np.isnan(base_sos), 0.5, base_sos)
+
+    # momentum proxy
+    with np.errstate(divide='ignore', invalid='ignore'):
+        momentum = np.where(base_ma != 0, (base_price - base_ma) / base_ma, 0.0)
+
+    # base probabilities influenced by momentum
+    base_up = np.fmax(0.05, np.fmin(0.85, 0.35 + momentum * 0.6))
+    base_down = np.fmax(0.05, np.fmin(0.85, 0.35 - momentum * 0.6))
+    base_flat = np.fmax(0.01, 1.0 - (base_up + base_down))
+    # normalize
+    ssum = base_up + base_down + base_flat
+
+    # (ticker, outcome) grid: DOWN/FLAT/UP columns
+    outcome_names = ('DOWN', 'FLAT', 'UP')
+    multipliers = np.array([0.90, 1.00, 1.10])
+    probs = np.stack([base_down, base_flat, base_up], axis=1) / ssum[:, None]
+    price_targets = base_price[:, None] * multipliers
+    # adjust sos slightly depending on direction
+    sos_raw = base_sos[:, None] * np.array([0.9, 1.0, 1.1])
+
+    # Build probabilistic outcome candidates for each ticker (e.g., Down/Flat/Up)
+    candidates = []
+    for ticker, price, ma, targets, outcome_probs, sos_row in zip(
+        tickers, base_price.tolist(), base_ma.tolist(),
+        price_targets.tolist(), probs.tolist(), sos_raw.tolist(),
+    ):
+        # Shown values are rounded with Python's round(), once per ticker or
+        # candidate (np.round can differ in the last digit)
+        price = round(price, 2)
+        ma = round(ma, 2)
+        for o_name, price_target, prob, sos in zip(outcome_names, targets, outcome_probs, sos_row):
+            price_target = round(price_target, 2)
+            candidates.append({
+                'ticker': ticker,
+                'price': price,
+                'price_target': price_target,
+                'probability': round(prob, 3),
+                'sos': max(0.01, min(0.99, round(sos, 3))),
+                'ma': ma,
+                'change_pct': round(((price_target - ma) / ma) * 100, 2) if ma != 0 else 0.0,
+                'outcome': o_name,
+            })
+
+    # rank candidates by combined strength (sos * probability), ties keeping
+    # candidate order
+    strength = np.fromiter((c['sos'] * c['probability'] for c in candidates), dtype=np.float64, count=len(candidates))
+    order = np.argsort(-strength, kind='stable')
+
+    # Ensure we have at least 64 candidates by cycling if needed
+    full_candidates = [candidates[i] for i in order[np.arange(len(POSITIONS)) % len(order)].tolist()]
+
+    # Build tiles for all 64 squares: map candidates to board positions. Stocks
+    # may repeat across multiple squares with slight price/SOS variations.
+    tiles = [
+        {
+            'ticker': c['ticker'],
+            'position': pos,
+            'rank': rank,
+            'file': file,
+            'square': square,
+            'sos': c['sos'],
+            'price': c['price'],
+            'price_target': c['price_target'],
+            'ma': c['ma'],
+            'change_pct': c['change_pct'],
+            'probability': c['probability'],
+            'outcome': c['outcome'],
+        }
+        for c, pos, (file, rank, square) in zip(full_candidates, POSITIONS, POSITION_META)
+    ]
+
+    if trader.tickers:
+        board_tiles_cache['key'] = key
+        board_tiles_cache['tiles'] = tiles
+    return tiles
+
+
 @app.route('/api/board-state', methods=['GET'])
+@serialized
 def get_board_state():
     """Get current board state."""
     global trader, current_date_idx
@@ -187,144 +415,7 @@ def get_board_state():
     try:
         state = trader.get_current_board_state(current_date_idx)
 
-        # current date index (timestamp) for data lookups
-        date_idx = trader.price_data.index[current_date_idx]
-        
-        # Build tiles for all 64 squares. Stocks may repeat across multiple squares with slight price/SOS variations.
-        tiles = []
-        files = ['A','B','C','D','E','F','G','H']
-        positions = [f + str(r) for r in range(8, 0, -1) for f in files]
-
-        tickers = trader.tickers if trader is not None and len(trader.tickers) > 0 else ['AAPL','MSFT','GOOGL','AMZN','TSLA']
-
-        # Build probabilistic outcome candidates for each ticker (e.g., Down/Flat/Up)
-        candidates = []
-        for ticker in tickers:
-            # base values
-            try:
-                base_price = float(trader.price_data.loc[date_idx, ticker])
-            except Exception:
-                base_price = 100.0 + random.randint(-5, 5)
-
-            try:
-                base_ma = float(trader.sos_data.loc[date_idx, (ticker, 'MA')])
-            except Exception:
-                base_ma = base_price * 0.98
-
-            try:
-                base_sos = float(trader.sos_data.loc[date_idx, (ticker, 'SOS')])
-                if pd.isna(base_sos):
-                    base_sos = 0.5
-            except Exception:
-                base_sos = 0.5
-
-            # momentum proxy
-            momentum = 0.0
-            try:
-                if base_ma != 0:
-                    momentum = (base_price - base_ma) / base_ma
-            except Exception:
-                momentum = 0.0
-
-            # base probabilities influenced by momentum
-            base_up = max(0.05, min(0.85, 0.35 + momentum * 0.6))
-            base_down = max(0.05, min(0.85, 0.35 - momentum * 0.6))
-            base_flat = max(0.01, 1.0 - (base_up + base_down))
-            # normalize
-            ssum = base_up + base_down + base_flat
-            base_up /= ssum
-            base_down /= ssum
-            base_flat /= ssum
-
-            outcomes = [
-                ('DOWN', 0.90, base_down),
-                ('FLAT', 1.00, base_flat),
-                ('UP', 1.10, base_up),
-            ]
-
-            for o_name, multiplier, prob in outcomes:
-                price_target = round(base_price * multiplier, 2)
-                # adjust sos slightly depending on direction
-                sos_adj = max(0.01, min(0.99, round(base_sos * (0.9 if o_name == 'DOWN' else 1.0 if o_name == 'FLAT' else 1.1), 3)))
-                candidates.append({
-                    'ticker': ticker,
-                    'price': round(base_price, 2),
-                    'price_target': price_target,
-                    'probability': round(prob, 3),
-                    'sos': sos_adj,
-                    'ma': round(base_ma, 2),
-                    'outcome': o_name,
-                })
-
-        # sort candidates by combined strength (sos * probability)
-        candidates.sort(key=lambda c: c['sos'] * c['probability'], reverse=True)
-
-        # Ensure we have at least 64 candidates by cycling if needed
-        full_candidates = []
-        idx = 0
-        while len(full_candidates) < len(positions):
-            full_candidates.append(candidates[idx % len(candidates)])
-            idx += 1
-
-        # map candidates to board positions
-        for i, pos in enumerate(positions):
-            c = full_candidates[i]
-            file = pos[0]
-            rank = int(pos[1])
-            tiles.append({
-                'ticker': c['ticker'],
-                'position': pos,
-                'rank': rank,
-                'file': file,
-                'square': SquareColor.WHITE.value if (ord(file) + rank) % 2 == 0 else SquareColor.BLACK.value,
-                'sos': c['sos'],
-                'price': c['price'],
-                'price_target': c['price_target'],
-                'ma': c['ma'],
-                'change_pct': round(((c['price_target'] - c['ma']) / c['ma']) * 100, 2) if c['ma'] != 0 else 0.0,
-                'probability': c['probability'],
-                'outcome': c['outcome'],
-            })
-
-        # Provide initial chess piece layout overlay - all 32 pieces in starting positions
-        pieces_layout = [
-            # White pieces (rank 1)
-            {'position': 'A1', 'piece': 'ROOK', 'color': 'WHITE'},
-            {'position': 'B1', 'piece': 'KNIGHT', 'color': 'WHITE'},
-            {'position': 'C1', 'piece': 'BISHOP', 'color': 'WHITE'},
-            {'position': 'D1', 'piece': 'QUEEN', 'color': 'WHITE'},
-            {'position': 'E1', 'piece': 'KING', 'color': 'WHITE'},
-            {'position': 'F1', 'piece': 'BISHOP', 'color': 'WHITE'},
-            {'position': 'G1', 'piece': 'KNIGHT', 'color': 'WHITE'},
-            {'position': 'H1', 'piece': 'ROOK', 'color': 'WHITE'},
-            # White pawns (rank 2)
-            {'position': 'A2', 'piece': 'PAWN', 'color': 'WHITE'},
-            {'position': 'B2', 'piece': 'PAWN', 'color': 'WHITE'},
-            {'position': 'C2', 'piece': 'PAWN', 'color': 'WHITE'},
-            {'position': 'D2', 'piece': 'PAWN', 'color': 'WHITE'},
-            {'position': 'E2', 'piece': 'PAWN', 'color': 'WHITE'},
-            {'position': 'F2', 'piece': 'PAWN', 'color': 'WHITE'},
-            {'position': 'G2', 'piece': 'PAWN', 'color': 'WHITE'},
-            {'position': 'H2', 'piece': 'PAWN', 'color': 'WHITE'},
-            # Black pawns (rank 7)
-            {'position': 'A7', 'piece': 'PAWN', 'color': 'BLACK'},
-            {'position': 'B7', 'piece': 'PAWN', 'color': 'BLACK'},
-            {'position': 'C7', 'piece': 'PAWN', 'color': 'BLACK'},
-            {'position': 'D7', 'piece': 'PAWN', 'color': 'BLACK'},
-            {'position': 'E7', 'piece': 'PAWN', 'color': 'BLACK'},
-            {'position': 'F7', 'piece': 'PAWN', 'color': 'BLACK'},
-            {'position': 'G7', 'piece': 'PAWN', 'color': 'BLACK'},
-            {'position': 'H7', 'piece': 'PAWN', 'color': 'BLACK'},
-            # Black pieces (rank 8)
-            {'position': 'A8', 'piece': 'ROOK', 'color': 'BLACK'},
-            {'position': 'B8', 'piece': 'KNIGHT', 'color': 'BLACK'},
-            {'position': 'C8', 'piece': 'BISHOP', 'color': 'BLACK'},
-            {'position': 'D8', 'piece': 'QUEEN', 'color': 'BLACK'},
-            {'position': 'E8', 'piece': 'KING', 'color': 'BLACK'},
-            {'position': 'F8', 'piece': 'BISHOP', 'color': 'BLACK'},
-            {'position': 'G8', 'piece': 'KNIGHT', 'color': 'BLACK'},
-            {'position': 'H8', 'piece': 'ROOK', 'color': 'BLACK'},
-        ]
+        tiles = build_board_tiles(trader, current_date_idx)
 
         # Final response
         return jsonify({
@@ -336,13 +427,14 @@ def get_board_state():
             'king_cash': round(trader.game_state.king_cash, 2) if trader is not None else 0.0,
             'pieces_deployed': trader.game_state.pieces_deployed if trader is not None else 0,
             'tiles': tiles,
-            'pieces': pieces_layout,
+            'pieces': PIECES_LAYOUT,
         })
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 400
 
 
 @app.route('/api/suggestions', methods=['GET'])
+@serialized
 def get_suggestions():
     """Get move suggestions."""
     global trader
@@ -373,6 +465,7 @@ def get_suggestions():
 
 
 @app.route('/api/piece-info', methods=['GET'])
+@serialized
 def get_piece_info():
     """Get piece inventory details."""
     global trader
@@ -405,6 +498,7 @@ def get_piece_info():
 
 
 @app.route('/api/next-day', methods=['POST'])
+@serialized
 def next_day():
     """Advance to next trading day."""
     global trader, current_date_idx
@@ -418,7 +512,7 @@ def next_day():
             return jsonify({
                 'status': 'success',
                 'message': f'Advanced to day {current_date_idx}',
-                'date': trader.price_data.index[current_date_idx].strftime('%Y-%m-%d'),
+                'date': trader.date_labels[current_date_idx],
                 'date_idx': current_date_idx,
             })
         else:
@@ -428,6 +522,7 @@ def next_day():
 
 
 @app.route('/api/prev-day', methods=['POST'])
+@serialized
 def prev_day():
     """Go back to previous trading day."""
     global trader, current_date_idx
@@ -441,7 +536,7 @@ def prev_day():
             return jsonify({
                 'status': 'success',
                 'message': f'Went back to day {current_date_idx}',
-                'date': trader.price_data.index[current_date_idx].strftime('%Y-%m-%d'),
+                'date': trader.date_labels[current_date_idx],
                 'date_idx': current_date_idx,
             })
         else:
@@ -451,6 +546,7 @@ def prev_day():
 
 
 @app.route('/api/deploy', methods=['POST'])
+@serialized
 def deploy():
     """Deploy a piece to a stock."""
     global trader, historical_trades
@@ -483,7 +579,7 @@ def deploy():
         trader.game_state.pieces_deployed += 1
         
         historical_trades.append({
-            'date': trader.price_data.index[current_date_idx].strftime('%Y-%m-%d'),
+            'date': trader.date_labels[current_date_idx],
             'action': 'BUY',
             'ticker': ticker,
             'piece': piece.piece_type.name,
@@ -499,6 +595,7 @@ def deploy():
 
 
 @app.route('/api/trades', methods=['GET'])
+@serialized
 def get_trades():
     """Get trade history."""
     global historical_trades
@@ -510,6 +607,7 @@ def get_trades():
 
 
 @app.route('/api/chess/legal_moves', methods=['GET'])
+@serialized
 def legal_moves():
     """Get legal moves for the current board state."""
     global chess_game
@@ -517,11 +615,32 @@ def legal_moves():
     if board is None:
         return jsonify({"status": "error", "message": "Board not initialized"}), 400
     
-    moves = [move.uci() for move in board.legal_moves]
+    fen = board.fen()
+    if legal_moves_cache['fen'] != fen:
+        names = pychess.SQUARE_NAMES
+        legal_moves_cache['moves'] = [
+            names[move.from_square] + names[move.to_square] + PROMOTION_SUFFIX[move.promotion or 0]
+            for move in board.legal_moves
+        ]
+        legal_moves_cache['fen'] = fen
+    moves = legal_moves_cache['moves']
     return jsonify({"status": "success", "legal_moves": moves})
 
 
+@functools.lru_cache(maxsize=512)
+def best_moves_for(fen, sos_items):
+    """
+    get_best_moves for a FEN and an SOS map given as sorted (square, score)
+    items, as (san, target square, score) tuples. Memoized, since the GUI asks
+    again for hints on positions it has already seen.
+    """
+    board = pychess.Board(fen)
+    moves = get_best_moves(board, sos_scores=dict(sos_items), num_moves=3)
+    return tuple((board.san(move), pychess.square_name(move.to_square), score) for move, score in moves)
+
+
 @app.route('/api/chess/suggest_moves', methods=['POST'])
+@serialized
 def suggest_moves():
     """Suggest best moves using the AI engine, factoring in SOS scores."""
     global chess_game
@@ -537,19 +656,16 @@ def suggest_moves():
     sos_scores = data.get('sos_scores', {})
     
     try:
-        # Create a board from FEN to ensure it's current
-        current_board = pychess.Board(fen)
-        
-        # Get best moves from the AI, now with SOS scores
-        moves = get_best_moves(current_board, sos_scores=sos_scores, num_moves=3)
+        # Get best moves from the AI (for a board built from the FEN, so it is
+        # current), now with SOS scores
+        moves = best_moves_for(fen, tuple(sorted(sos_scores.items())))
 
         formatted_moves = []
-        for move, score in moves:
-            san_move = current_board.san(move)
+        for san_move, to_square, score in moves:
             reason = f"Combines tactical advantage (score: {score:.2f}) with board opportunities."
             # Add specific reason if it moves to a high SOS square
-            if sos_scores.get(pychess.square_name(move.to_square), 0) > 0.6:
-                reason = f"Excellent move to a high-opportunity square (SOS: {sos_scores.get(pychess.square_name(move.to_square)):.3f}). Score: {score:.2f}."
+            if sos_scores.get(to_square, 0) > 0.6:
+                reason = f"Excellent move to a high-opportunity square (SOS: {sos_scores.get(to_square):.3f}). Score: {score:.2f}."
 
             formatted_moves.append({
                 "move": san_move,
@@ -569,8 +685,18 @@ def main():
     print("\n🌐 Starting web server...")
     print("📍 Open your browser to: http://localhost:5000")
     print("\n" + "="*80 + "\n")
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
+
+    # Werkzeug's debugger/reloader only when asked for; otherwise serve with
+    # waitress when it is installed
+    if os.environ.get('CHESS_GUI_DEBUG'):
+        app.run(debug=True, host='0.0.0.0', port=5000)
+        return
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='0.0.0.0', port=5000, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=5000, threads=8)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,73 @@
+"""Tests for chess_ai (run with: python -m unittest test_chess_ai)."""
+
+import math
+import unittest
+
+import chess
+
+import chess_ai
+
+
+class SearchRootParallelTest(unittest.TestCase):
+    """search_root_parallel against the serial root search."""
+
+    SOS = {'e4': 0.8, 'd5': 0.9, 'f7': 0.7}
+    DEPTH = 3
+    NUM_MOVES = 3
+
+    def setUp(self):
+        # Count serial full-window root searches (ply 1) made in this process
+        self.full_searches = 0
+        minimax = chess_ai.minimax
+
+        def counting_minimax(board, depth, alpha, beta, maximizing_for_white, sos_scores, ply=0, pieces=None):
+            if ply == 1 and alpha == -math.inf and beta == math.inf:
+                self.full_searches += 1
+            return minimax(board, depth, alpha, beta, maximizing_for_white, sos_scores, ply, pieces)
+
+        chess_ai.minimax = counting_minimax
+        self.addCleanup(setattr, chess_ai, 'minimax', minimax)
+        self.serial_minimax = minimax
+
+    def ranked(self, board, scored):
+        """(uci, score) best first for the side to move, ties as in get_best_moves."""
+        white = board.turn == chess.WHITE
+        sign = 1 if white else -1
+        scored = sorted(scored, key=lambda r: r[1], reverse=white)
+        scored.sort(key=lambda r: sign * r[1], reverse=True)
+        return [(move.uci(), score) for move, score in scored]
+
+    def check_position(self, fen):
+        board = chess.Board(fen)
+        sign = 1 if board.turn == chess.WHITE else -1
+        moves = list(board.legal_moves)
+
+        chess_ai.reset_search_state(self.SOS)
+        sos = chess_ai.prepare_sos(self.SOS)
+        serial = []
+        for move in moves:
+            board.push(move)
+            serial.append((move, self.serial_minimax(board, self.DEPTH - 1, -math.inf, math.inf,
+                                                     board.turn == chess.WHITE, sos, 1)))
+            board.pop()
+
+        chess_ai.reset_search_state(self.SOS)
+        self.full_searches = 0
+        parallel = chess_ai.search_root_parallel(
+            board, moves, self.DEPTH, self.SOS, lambda move, score: sign * score, self.NUM_MOVES, 2,
+        )
+
+        top = self.NUM_MOVES
+        self.assertEqual(self.ranked(board, parallel)[:top], self.ranked(board, serial)[:top])
+        # The first move plus at most a re-search per slot besides it
+        self.assertLessEqual(self.full_searches, self.NUM_MOVES)
+
+    def test_black_to_move(self):
+        self.check_position("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 3 3")
+
+    def test_white_to_move(self):
+        self.check_position("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+
+
+if __name__ == '__main__':
+    unittest.main()